@@ -91,6 +91,13 @@ class IndexSetBase(Generic[ElemT]):
         # Printable string representation.
         return self._list.__repr__()
 
+    def __copy__(self) -> Self:
+        # Shallow copy `copy.copy(self)` with new internal containers of the same elements.
+        new = self.__class__.__new__(self.__class__)
+        new._list = self._list.copy()
+        new._set = self._set.copy()
+        return new
+
     def _ensure_no_duplicates(self, elems: list[ElemT]) -> set[ElemT]:
         """Ensure that a list of elements has no duplicates and coerce it to a set.
 
@@ -127,6 +134,26 @@ class IndexSetBase(Generic[ElemT]):
         # No checks in the base class; so always return True
         return True  # pragma: no cover
 
+    def _add_elements(self, elems: list[ElemT]) -> None:
+        """Add new elements to the set of the IndexSet, ensuring that no duplicates are introduced.
+
+        Only the new elements are hashed, so that adding a few elements to a large IndexSet does not
+        rebuild its whole set.
+
+        Parameters
+        ----------
+        elems : list
+
+        Raises
+        ------
+        ValueError
+            If any element is already present in the IndexSet or the list has duplicates.
+        """
+        new = set(elems)
+        if len(elems) > len(new) or not self._set.isdisjoint(new):
+            raise ValueError(f'input introduced duplicates in {self.__class__.__name__}')
+        self._set |= new
+
     def _remove_elements(self, elems: list[ElemT]) -> None:
         """Remove elements from the IndexSet.
 
@@ -163,13 +190,15 @@ class IndexSetBase(Generic[ElemT]):
         # Rich comparison `self == other` (equivalence), if other is also of the same type.
         if not isinstance(other, self.__class__):
             self._raise_op_not_supported_err('==')
-        return self._set == other._set
+        # `set.__eq__` already rejects sets of different lengths in O(1); also skip the
+        # element-wise check when comparing an IndexSet with itself
+        return self is other or self._set == other._set
 
     def __ne__(self, other: object, /) -> bool:
         # Rich comparison `self != other` (non-equivalence), if other is also of the same type.
         if not isinstance(other, self.__class__):
             self._raise_op_not_supported_err('!=')
-        return self._set != other._set
+        return self is not other and self._set != other._set
 
     def __gt__(self, other: Self, /) -> bool:
         # Rich comparison `self > other` (proper superset), if other is also of the same type.
@@ -208,9 +237,8 @@ class IndexSetBase(Generic[ElemT]):
                     f'can only concatenate an iterable to {self.__class__.__name__}'
                 ) from None
             if self._validate_elements(lst_other):
-                added = self._list + lst_other
-                self._set = self._ensure_no_duplicates(added)
-                self._list = added
+                self._add_elements(lst_other)
+                self._list.extend(lst_other)
         return self
 
     @overload
@@ -232,12 +260,12 @@ class IndexSetBase(Generic[ElemT]):
 
     def _setitem_idx(self, index: SupportsIndex, elem: ElemT, /) -> None:
         # __setitem__ implementation for `index` input.
+        try:
+            old: ElemT = self._list[index]  # access old elem at given position index
+        except IndexError:
+            raise IndexError('position index out of range') from None
         lst_elem = [elem]
         if self._validate_elements(lst_elem):
-            try:
-                old: ElemT = self._list[index]  # access old elem at given position index
-            except IndexError:
-                raise IndexError('position index out of range') from None
             try:
                 self._list[index] = elem
                 self._set = self._ensure_no_duplicates(self._list)
@@ -356,7 +384,7 @@ class IndexSetBase(Generic[ElemT]):
         """
         new = [elem]
         if self._validate_elements(new):
-            self._set = self._ensure_no_duplicates(self._list + new)
+            self._add_elements(new)
             self._list.append(elem)
 
     def extend(self, elems: Iterable[ElemT], /) -> None:
@@ -378,7 +406,7 @@ class IndexSetBase(Generic[ElemT]):
         except TypeError:
             raise TypeError(f'can only extend {self.__class__.__name__} with an iterable') from None
         if self._validate_elements(new):
-            self._set = self._ensure_no_duplicates(self._list + new)
+            self._add_elements(new)
             self._list.extend(new)
 
     def insert(self, index: SupportsIndex, elem: ElemT, /) -> None:
@@ -400,7 +428,7 @@ class IndexSetBase(Generic[ElemT]):
             case int():
                 elems = [elem]
                 if self._validate_elements(elems):
-                    self._set = self._ensure_no_duplicates(self._list + elems)
+                    self._add_elements(elems)
                     self._list.insert(index, elem)
             case _:
                 raise TypeError(f'position index must be an integer, not {type(index).__name__}')
@@ -474,7 +502,14 @@ class IndexSetBase(Generic[ElemT]):
             When the IndexSet has non-comparable elements i.e., heterogeneous data types like `int`
             and `str` within the same IndexSet.
         """
-        self._list.sort(key=key, reverse=reverse)
+        # Sort in-place, but restore the original order if the sort fails midway since `list.sort`
+        # can leave the list partially sorted
+        old = self._list.copy()  # copy the list before changing
+        try:
+            self._list.sort(key=key, reverse=reverse)
+        except Exception:
+            self._list = old  # restore the list
+            raise
 
     def reverse(self) -> None:
         """Reverse the order of elements of the IndexSet, in-place."""
@@ -595,6 +630,12 @@ class IndexSet1D(IndexSetBase[Elem1DT]):
         # Printable string representation.
         return f'{self._get_repr_header()}\n{self._list.__repr__()}'
 
+    def __copy__(self) -> Self:
+        # Shallow copy `copy.copy(self)` with the same `name` attribute.
+        new = super().__copy__()
+        new._name = self._name
+        return new
+
     def _repr_pretty_(self, p: MinimalRepresentationPrinter, cycle: bool) -> None:
         # Pretty repr for IPython.
         # https://ipython.readthedocs.io/en/stable/api/generated/IPython.lib.pretty.html#extending
@@ -1009,6 +1050,10 @@ class IndexSetND(IndexSetBase[ElemNDT]):
                     # if product combinations are nested iterables, flatten to tuple elements
                     if any(isinstance(i, Iterable) and not isinstance(i, str) for i in elems[0]):
                         elems = [tuple(self._flatten(x)) for x in elems]
+                    # otherwise, combinations of scalars are tuples of the same length by
+                    # construction and don't need to be validated element by element
+                    else:
+                        self._tuplelen = len(iterables)
 
             else:
                 try:
@@ -1025,10 +1070,13 @@ class IndexSetND(IndexSetBase[ElemNDT]):
                 ):
                     elems = [tuple(elem) for elem in elems]
 
-            if elems:  # is populated
-                super().__init__(cast('list[ElemNDT]', elems))
-            else:
+            if not elems:  # is empty
                 super().__init__(None)
+            elif hasattr(self, '_tuplelen'):  # is pre-validated
+                self._set = self._ensure_no_duplicates(cast('list[ElemNDT]', elems))
+                self._list = cast('list[ElemNDT]', elems)
+            else:
+                super().__init__(cast('list[ElemNDT]', elems))
 
         else:
             super().__init__(None)
@@ -1068,6 +1116,16 @@ class IndexSetND(IndexSetBase[ElemNDT]):
         # Printable string representation.
         return f'{self._get_repr_header()}\n{self._list.__repr__()}'
 
+    def __copy__(self) -> Self:
+        # Shallow copy `copy.copy(self)` with the same `names` attribute.
+        # The cache of index groups is not carried over and will be rebuilt on demand.
+        new = super().__copy__()
+        new._names = None if self._names is None else list(self._names)
+        new._index_groups = {}
+        if hasattr(self, '_tuplelen'):
+            new._tuplelen = self._tuplelen
+        return new
+
     def _repr_pretty_(self, p: MinimalRepresentationPrinter, cycle: bool) -> None:
         # Pretty repr for IPython.
         # https://ipython.readthedocs.io/en/stable/api/generated/IPython.lib.pretty.html#extending
@@ -1269,6 +1327,31 @@ class IndexSetND(IndexSetBase[ElemNDT]):
 
         return unique
 
+    @override
+    def _add_elements(self, elems: list[ElemNDT]) -> None:
+        """Add new elements to the set of the IndexSet, ensuring that no duplicates are introduced.
+
+        Parameters
+        ----------
+        elems : list
+
+        Raises
+        ------
+        ValueError
+            If any element is already present in the IndexSet or the list has duplicates.
+
+        Notes
+        -----
+        Given that adding new elements will modify the IndexSet, we'll reset the following private
+        attributes:
+        (1) _index_groups : Clear this dict and reconstruct when the user calls `subset` or
+            `squeeze` rather than defining a complicated logic to update it.
+        """
+        super()._add_elements(elems)
+
+        if self._index_groups:  # is populated
+            self._index_groups.clear()
+
     @override
     def _remove_elements(self, elems: list[ElemNDT]) -> None:
         """Remove elements from the IndexSet.
@@ -1316,6 +1399,56 @@ class IndexSetND(IndexSetBase[ElemNDT]):
         except AttributeError:
             pass
 
+    @override
+    def sort(
+        self,
+        *,
+        key: Callable[[ElemNDT], SupportsRichComparison] | None = None,
+        reverse: bool = False,
+    ) -> None:
+        """Sort the IndexSet in ascending order, in-place.
+
+        Parameters
+        ----------
+        key : function, optional
+            Function to be applied to each element to get comparison keys for sorting order, by
+            default ``None``.
+        reverse : bool, default ``False``
+            Whether to sort in descending order.
+
+        Raises
+        ------
+        TypeError
+            When the IndexSet has non-comparable elements i.e., heterogeneous data types like `int`
+            and `str` within the same IndexSet.
+        """
+        # Notes
+        # -----
+        # Given that sorting will reorder the elements of the IndexSet, we'll reset the following
+        # private attributes:
+        # (1) `_index_groups`: Clear this dict and reconstruct when the user calls `subset` or
+        #     `squeeze` so that their outputs follow the new order.
+
+        super().sort(key=key, reverse=reverse)
+
+        if self._index_groups:  # is populated
+            self._index_groups.clear()
+
+    @override
+    def reverse(self) -> None:
+        """Reverse the order of elements of the IndexSet, in-place."""
+        # Notes
+        # -----
+        # Given that reversing will reorder the elements of the IndexSet, we'll reset the following
+        # private attributes:
+        # (1) `_index_groups`: Clear this dict and reconstruct when the user calls `subset` or
+        #     `squeeze` so that their outputs follow the new order.
+
+        super().reverse()
+
+        if self._index_groups:  # is populated
+            self._index_groups.clear()
+
     def intersection(self, *others: Iterable[Any]) -> IndexSetND[ElemNDT]:
         """Return a new IndexSetND with elements common to the IndexSetND and all others.
 
@@ -1508,13 +1641,15 @@ class IndexSetND(IndexSetBase[ElemNDT]):
             return self._index_groups[indices]
 
         # Create new grouping otherwise, and cache for future use
+        # Build the getter once so that each element only pays for reading the given dimensions
+        getter = itemgetter(*indices)
         group: IndexGroup[ElemNDT] = defaultdict(list)
         if len(indices) == 1:
-            for elem in self._list:
-                group[(itemgetter(*indices)(elem),)].append(elem)
+            for key, elem in zip(map(getter, self._list), self._list, strict=True):
+                group[(key,)].append(elem)
         else:
-            for elem in self._list:
-                group[itemgetter(*indices)(elem)].append(elem)
+            for key, elem in zip(map(getter, self._list), self._list, strict=True):
+                group[key].append(elem)
         self._index_groups[indices] = group
 
         return group
@@ -1561,24 +1696,29 @@ class IndexSetND(IndexSetBase[ElemNDT]):
         if not self._list:  # is empty
             raise LookupError(f'{self.__class__.__name__} is empty')
 
-        if any((isinstance(v, Iterable) and not isinstance(v, str)) for v in pattern):
-            raise TypeError('pattern values must be scalars (no iterables except string)')
+        # Split the pattern into the fixed dimension indices and their values in a single pass;
+        # the wildcard dimensions are skipped entirely
+        indices: list[int] = []
+        given: list[Any] = []
+        for i, v in enumerate(pattern):
+            if isinstance(v, Iterable) and not isinstance(v, str):
+                raise TypeError('pattern values must be scalars (no iterables except string)')
+            if v != '*':
+                indices.append(i)
+                given.append(v)
 
         if len(pattern) != self._tuplelen:
             raise ValueError('pattern length must be the same as that of N-dim tuple elements')
 
-        indices = tuple(i for i, v in enumerate(pattern) if v != '*')  # Wildcard filtering
         if len(indices) == 0:
             raise ValueError('pattern cannot have all wildcards')
         if len(indices) == self._tuplelen:
             raise ValueError('pattern cannot have no wildcards')
 
-        given = tuple(v for v in pattern if v != '*')  # Wildcard filtering
-
         # Use get instead of __getitem__ because we don't want to update the defaultdict[list] (with
         # an empty list) for keys that are not preset prior to returning the empty list. Can
         # directly return an empty list with get instead.
-        return self._groupby(*indices).get(given, list())
+        return self._groupby(*indices).get(tuple(given), list())
 
     @overload
     def squeeze(  # numpydoc ignore=GL08
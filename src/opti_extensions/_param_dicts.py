@@ -12,6 +12,8 @@ from collections.abc import Callable, Iterable, MutableMapping, Sequence
 from functools import partial
 from typing import TYPE_CHECKING, Any, Literal, NoReturn, TypeVar, cast, overload
 
+from typing_extensions import override
+
 from ._dict_mixins import DefaultT, Dict1DMixin, DictBaseMixin, DictNDMixin
 from ._index_sets import Elem1DT, ElemNDT, ElemT, IndexSet1D, IndexSetBase, IndexSetND
 
@@ -34,6 +36,9 @@ _builtin_op: dict[str, Callable[..., int | float]] = {
     'max': partial(max, default=0),
 }
 
+# Max number of partial-pattern statistics cached per ParamDictND
+_STAT_CACHE_MAXSIZE = 128
+
 
 class ParamDictBase(dict[ElemT, ParamT], DictBaseMixin[ElemT, ParamT]):
     """Base class for custom subclasses of `dict` to define parameters.
@@ -91,6 +96,7 @@ class ParamDictBase(dict[ElemT, ParamT], DictBaseMixin[ElemT, ParamT]):
                     super().__setitem__(key, value)
                 except Exception as exc:
                     self._reraise_exc_from_indexset(exc)
+            self._reset_caches()
         else:
             raise TypeError('`value` should be either int or float')
 
@@ -98,11 +104,16 @@ class ParamDictBase(dict[ElemT, ParamT], DictBaseMixin[ElemT, ParamT]):
         # Remove `self[key]`.
         super().__delitem__(key)
         self._indexset.remove(key)
+        self._reset_caches()
 
     def clear(self) -> None:
         """Remove all items from the ParamDict."""
         super().clear()
         self._indexset.clear()
+        self._reset_caches()
+
+    def _reset_caches(self) -> None:
+        """Reset any results cached from the parameter values, as they have been modified."""
 
     def copy(self) -> NoReturn:
         """Not supported by ParamDict."""
@@ -162,6 +173,7 @@ class ParamDictBase(dict[ElemT, ParamT], DictBaseMixin[ElemT, ParamT]):
         """
         if key in self:
             self._indexset.remove(key)
+            self._reset_caches()
         if isinstance(default, _RAISE_KEYERROR):
             return super().pop(key)
         else:
@@ -177,6 +189,7 @@ class ParamDictBase(dict[ElemT, ParamT], DictBaseMixin[ElemT, ParamT]):
         """
         item = super().popitem()
         self._indexset.remove(item[0])
+        self._reset_caches()
         return item
 
     def setdefault(self, key: ElemT, default: ParamT, /) -> ParamT:
@@ -199,6 +212,7 @@ class ParamDictBase(dict[ElemT, ParamT], DictBaseMixin[ElemT, ParamT]):
                     self._indexset.append(key)
                 except Exception as exc:
                     self._reraise_exc_from_indexset(exc)
+                self._reset_caches()
             return super().setdefault(key, default)
         raise TypeError('`default` should be either int or float')
 
@@ -227,7 +241,7 @@ class ParamDictBase(dict[ElemT, ParamT], DictBaseMixin[ElemT, ParamT]):
         StatisticsError
             If the ParamDict is empty.
         """
-        if stat_func not in ('sum', 'min', 'max') and not hasattr(statistics, stat_func):
+        if stat_func not in _builtin_op and not hasattr(statistics, stat_func):
             raise ValueError('Given `stat_func` not found in the `statistics` module')
         if not self:
             raise statistics.StatisticsError(
@@ -250,7 +264,7 @@ class ParamDictBase(dict[ElemT, ParamT], DictBaseMixin[ElemT, ParamT]):
         -------
         int or float
         """
-        if stat_func in ('sum', 'min', 'max'):
+        if stat_func in _builtin_op:
             res: int | float = _builtin_op[stat_func](self.values())
         else:
             res = getattr(statistics, stat_func)(self.values())
@@ -587,8 +601,10 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
     # ------------------
     # _indexset : IndexSetND
     #     Index-set of N-dim tuple keys.
+    # _stat_cache : dict[tuple[str, tuple], int | float]
+    #     Cache of statistics calculated with a subset based on wildcard pattern.
 
-    __slots__ = ('_key_names', '_value_name')
+    __slots__ = ('_key_names', '_value_name', '_stat_cache')
 
     def __init__(
         self,
@@ -601,6 +617,9 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
         self.key_names = key_names
         self.value_name = value_name
 
+        self._stat_cache: dict[tuple[str, tuple[Any, ...]], int | float] = {}
+        """Cache of statistics calculated with a subset based on wildcard pattern."""
+
         if mapping is None:
             mapping = {}
             self._indexset = cast('IndexSetND[ElemNDT]', IndexSetND(names=self.key_names))
@@ -644,11 +663,34 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
         >>> demand.lookup('B', 'A')
         0
         """
+        # Keys in the ParamDict were validated on insertion, so a hit is returned directly and only
+        # a miss needs the key to be validated; parameter values are never None
+        try:
+            value = super().get(cast('ElemNDT', key))
+        except TypeError:  # unhashable key, rejected by the validation below
+            value = None
+        if value is not None:
+            return value
+
         if any((isinstance(k, Iterable) and not isinstance(k, str)) for k in key):
             raise TypeError('lookup key must be scalars (no iterables except string)')
         if len(key) != self._indexset._tuplelen:
             raise ValueError('lookup key length must be the same as that of N-dim tuple keys')
-        return super().get(cast('ElemNDT', key), 0)
+        return 0
+
+    @override
+    def _reset_caches(self) -> None:
+        """Reset any results cached from the parameter values, as they have been modified.
+
+        Notes
+        -----
+        Given that the keys or values of the ParamDict have been modified, we'll reset the following
+        private attributes:
+        (1) _stat_cache : Clear this dict and recalculate the statistics when the user asks for them
+            again rather than defining a complicated logic to update it.
+        """
+        if self._stat_cache:  # is populated
+            self._stat_cache.clear()
 
     def _calc_stat(self, *pattern: Any, stat_func: str) -> int | float:
         """Calculate a statistic with all parameter values or a subset based on wildcard pattern.
@@ -683,16 +725,30 @@ class ParamDictND(ParamDictBase[ElemNDT, ParamT], DictNDMixin[ElemNDT, ParamT]):
         ValueError
             If the pattern has no wildcard or all wildcards.
         """
+        # Statistics of a subset are cached until the ParamDict is modified, and only after passing
+        # all validations, so a cache hit can skip them; patterns that are not hashable are left to
+        # fail the validation in `subset_values`
+        if pattern:
+            try:
+                return self._stat_cache[stat_func, pattern]
+            except (KeyError, TypeError):
+                pass
+
         self._check_for_calc_stat(stat_func)
-        if stat_func in ('sum', 'min', 'max') and pattern:
+        if not pattern:
+            return self._calc_stat_all(stat_func)
+
+        if stat_func in _builtin_op:
             res: int | float = _builtin_op[stat_func](self.subset_values(*pattern))
-        elif pattern:
+        else:
             try:
                 res = getattr(statistics, stat_func)(self.subset_values(*pattern))
             except statistics.StatisticsError:
                 res = 0
-        else:
-            res = self._calc_stat_all(stat_func)
+
+        if len(self._stat_cache) >= _STAT_CACHE_MAXSIZE:  # evict the oldest entry
+            del self._stat_cache[next(iter(self._stat_cache))]
+        self._stat_cache[stat_func, pattern] = res
 
         return res
 
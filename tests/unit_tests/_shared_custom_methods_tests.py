@@ -68,20 +68,24 @@ def test_vardictNd_lookup_valerr(model, add_vars_fn, add_vars_kwargs, key):
 
 # ---- sum partial pattern tests ----
 
+# Index-sets shared by several rows, so that their VarDicts can be created once per module
+SETND_CMB2 = IndexSetND(range(2), range(2))
+SETND_ABC_CMB2 = IndexSetND(['A', 'B', 'C'], range(2))
+
 SUM_PARTIAL_PASS_CASES = [
-    [IndexSetND(range(2), range(2)), (0, '*')],
-    [IndexSetND(range(2), range(2)), ('*', 0)],
-    [IndexSetND(range(2), range(2)), (9, '*')],
-    [IndexSetND(['A', 'B', 'C'], range(2)), ('A', '*')],
-    [IndexSetND(['A', 'B', 'C'], range(2)), ('*', 0)],
-    [IndexSetND(['A', 'B', 'C'], range(2)), ('*', 'Z')],
+    [SETND_CMB2, (0, '*')],
+    [SETND_CMB2, ('*', 0)],
+    [SETND_CMB2, (9, '*')],
+    [SETND_ABC_CMB2, ('A', '*')],
+    [SETND_ABC_CMB2, ('*', 0)],
+    [SETND_ABC_CMB2, ('*', 'Z')],
     [IndexSetND(['A', 'B', 'C'], [0]), ('B', '*')],
 ]
 
 SUM_PARTIAL_VALERR_CASES = [
-    [IndexSetND(range(2), range(2)), (0, 0)],
-    [IndexSetND(range(2), range(2)), ('*', '*')],
-    [IndexSetND(range(2), range(2)), (0, 0, 0)],
+    [SETND_CMB2, (0, 0)],
+    [SETND_CMB2, ('*', '*')],
+    [SETND_CMB2, (0, 0, 0)],
 ]
 
 
@@ -6,6 +6,8 @@
 
 import pytest
 
+SUBSET_METHODS = ('subset_keys', 'subset_values')
+
 SUBSET_KEYS_CASES = [
     ('setNd_cmb2', ('*', 1), [(0, 1), (1, 1)]),
     ('setNd_cmb2', (0, '*'), [(0, 0), (0, 1)]),
@@ -33,57 +35,35 @@ SUBSET_VALUES_CASES = [
 ]
 
 
-@pytest.mark.parametrize('_input, values, expected', SUBSET_KEYS_CASES)
-def test_subset_keys_pass(model, add_vars_fn, add_vars_kwargs, request, _input, values, expected):
-    indexset = request.getfixturevalue(_input)
-    v = add_vars_fn(model, indexset, **add_vars_kwargs)
-    assert v.subset_keys(*values) == expected
-
-
-@pytest.mark.parametrize('values', [(0, '*'), (0, '*', 2, '*')])
-def test_subset_keys_diff_tuplelen(model, add_vars_fn, add_vars_kwargs, setNd_cmb3, values):
-    v = add_vars_fn(model, setNd_cmb3, **add_vars_kwargs)
-    with pytest.raises(ValueError):
-        v.subset_keys(*values)
-
-
-@pytest.mark.parametrize('values', [((0, 1), (0, 0)), [(0, 1)]])
-def test_subset_keys_nonscaler(model, add_vars_fn, add_vars_kwargs, setNd_cmb2, values):
-    v = add_vars_fn(model, setNd_cmb2, **add_vars_kwargs)
-    with pytest.raises(TypeError):
-        v.subset_keys(*values)
-
-
-@pytest.mark.parametrize('values', [('*', '*'), (0, 1)])
-def test_subset_keys_invalid_values(model, add_vars_fn, add_vars_kwargs, setNd_cmb2, values):
-    v = add_vars_fn(model, setNd_cmb2, **add_vars_kwargs)
-    with pytest.raises(ValueError):
-        v.subset_keys(*values)
-
-
-@pytest.mark.parametrize('_input, values, expected', SUBSET_VALUES_CASES)
-def test_subset_values_pass(model, add_vars_fn, add_vars_kwargs, request, _input, values, expected):
-    indexset = request.getfixturevalue(_input)
-    v = add_vars_fn(model, indexset, **add_vars_kwargs)
-    assert v.subset_values(*values) == [v[x] for x in v.subset_keys(*values)]
-
-
-@pytest.mark.parametrize('values', [(0, '*'), (0, '*', 2, '*')])
-def test_subset_values_diff_tuplelen(model, add_vars_fn, add_vars_kwargs, setNd_cmb3, values):
-    v = add_vars_fn(model, setNd_cmb3, **add_vars_kwargs)
-    with pytest.raises(ValueError):
-        v.subset_values(*values)
-
-
-@pytest.mark.parametrize('values', [((0, 1), (0, 0)), [(0, 1)]])
-def test_subset_values_nonscaler(model, add_vars_fn, add_vars_kwargs, setNd_cmb2, values):
-    v = add_vars_fn(model, setNd_cmb2, **add_vars_kwargs)
-    with pytest.raises(TypeError):
-        v.subset_values(*values)
-
-
-@pytest.mark.parametrize('values', [('*', '*'), (0, 1)])
-def test_subset_values_invalid_values(model, add_vars_fn, add_vars_kwargs, setNd_cmb2, values):
-    v = add_vars_fn(model, setNd_cmb2, **add_vars_kwargs)
-    with pytest.raises(ValueError):
-        v.subset_values(*values)
+@pytest.mark.parametrize(
+    'input_vardict, values, expected', SUBSET_KEYS_CASES, indirect=['input_vardict']
+)
+def test_subset_keys_pass(input_vardict, values, expected):
+    assert input_vardict.subset_keys(*values) == expected
+
+
+@pytest.mark.parametrize(
+    'input_vardict, values, expected', SUBSET_VALUES_CASES, indirect=['input_vardict']
+)
+def test_subset_values_pass(input_vardict, values, expected):
+    assert input_vardict.subset_values(*values) == [
+        input_vardict[x] for x in input_vardict.subset_keys(*values)
+    ]
+
+
+@pytest.mark.parametrize('method', SUBSET_METHODS)
+@pytest.mark.parametrize(
+    'input_vardict, values, exc',
+    [
+        ('setNd_cmb3', (0, '*'), ValueError),
+        ('setNd_cmb3', (0, '*', 2, '*'), ValueError),
+        ('setNd_cmb2', ((0, 1), (0, 0)), TypeError),
+        ('setNd_cmb2', [(0, 1)], TypeError),
+        ('setNd_cmb2', ('*', '*'), ValueError),
+        ('setNd_cmb2', (0, 1), ValueError),
+    ],
+    indirect=['input_vardict'],
+)
+def test_subset_error(input_vardict, values, exc, method):
+    with pytest.raises(exc):
+        getattr(input_vardict, method)(*values)
@@ -17,3 +17,29 @@ def setNd_cmb2():
 @pytest.fixture
 def setNd_cmb3():
     return IndexSetND(range(2), range(2), range(2))
+
+
+@pytest.fixture(scope='module')
+def vardict_cache():
+    # VarDicts live only as long as the module-scoped solver models they are created in
+    return {}
+
+
+@pytest.fixture
+def cached_vardict(model, add_vars_fn, add_vars_kwargs, vardict_cache):
+    """Create the VarDict of an index-set once per module, for tests that only read it."""
+
+    def _get(indexset, key=None):
+        key = id(indexset) if key is None else key
+        if key not in vardict_cache:
+            # Keep the index-set alive alongside its VarDict so that its id is never reused
+            vardict_cache[key] = (indexset, add_vars_fn(model, indexset, **add_vars_kwargs))
+        return vardict_cache[key][1]
+
+    return _get
+
+
+@pytest.fixture
+def input_vardict(request, cached_vardict):
+    """Resolve the VarDict of the index-set fixture named by an indirect parametrize value."""
+    return cached_vardict(request.getfixturevalue(request.param), key=request.param)
@@ -5,7 +5,9 @@
 """Helper functionality for testing index-sets."""
 
 from contextlib import contextmanager
-from copy import deepcopy
+from copy import copy
+
+_UNSET = object()
 
 
 def assert_sets_same(first, second):
@@ -70,8 +72,12 @@ def assert_not_mutated(input):
      ...
     AssertionError
     """
-    ref = deepcopy(input)
+    ref = copy(input)
     try:
         yield input
     finally:
         assert_sets_same(input, ref)
+        # Failed operations must not leave behind any state outside the elements either
+        # (an empty IndexSetND has no `_tuplelen` yet, so an unset slot must stay unset)
+        for attr in ('_name', '_names', '_tuplelen'):
+            assert getattr(input, attr, _UNSET) == getattr(ref, attr, _UNSET)
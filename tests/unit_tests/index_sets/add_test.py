@@ -37,38 +37,61 @@ pass_testdata = [
     ('setNd_01', ((0, 2), (0, 3)), IndexSetND([(0, 0), (0, 1), (0, 2), (0, 3)])),
 ]
 
+iadd_testdata = [
+    ('set1d_emp_mut', IndexSet1D(), IndexSet1D()),
+    ('set1d_emp_mut', [], IndexSet1D()),
+    ('set1d_emp_mut', (), IndexSet1D()),
+    ('set1d_emp_mut', IndexSet1D([0, 1]), IndexSet1D([0, 1])),
+    ('set1d_emp_mut', [0, 1], IndexSet1D([0, 1])),
+    ('set1d_emp_mut', (0, 1), IndexSet1D([0, 1])),
+    ('set1d_01_mut', IndexSet1D(), IndexSet1D([0, 1])),
+    ('set1d_01_mut', [], IndexSet1D([0, 1])),
+    ('set1d_01_mut', (), IndexSet1D([0, 1])),
+    ('set1d_01_mut', IndexSet1D([2, 3]), IndexSet1D([0, 1, 2, 3])),
+    ('set1d_01_mut', [2, 3], IndexSet1D([0, 1, 2, 3])),
+    ('set1d_01_mut', (2, 3), IndexSet1D([0, 1, 2, 3])),
+    ('setNd_emp_mut', IndexSetND(), IndexSetND()),
+    ('setNd_emp_mut', [], IndexSetND()),
+    ('setNd_emp_mut', (), IndexSetND()),
+    ('setNd_emp_mut', IndexSetND([(0, 0), (0, 1)]), IndexSetND([(0, 0), (0, 1)])),
+    ('setNd_emp_mut', [(0, 0), (0, 1)], IndexSetND([(0, 0), (0, 1)])),
+    ('setNd_emp_mut', ((0, 0), (0, 1)), IndexSetND([(0, 0), (0, 1)])),
+    ('setNd_01_mut', IndexSetND(), IndexSetND([(0, 0), (0, 1)])),
+    ('setNd_01_mut', [], IndexSetND([(0, 0), (0, 1)])),
+    ('setNd_01_mut', (), IndexSetND([(0, 0), (0, 1)])),
+    ('setNd_01_mut', IndexSetND([(0, 2), (0, 3)]), IndexSetND([(0, 0), (0, 1), (0, 2), (0, 3)])),
+    ('setNd_01_mut', [(0, 2), (0, 3)], IndexSetND([(0, 0), (0, 1), (0, 2), (0, 3)])),
+    ('setNd_01_mut', ((0, 2), (0, 3)), IndexSetND([(0, 0), (0, 1), (0, 2), (0, 3)])),
+]
+
 
-@pytest.mark.parametrize('_input, other, expected', pass_testdata)
-def test_set_add_pass(request, _input, other, expected):
-    input = request.getfixturevalue(_input)
-    assert_sets_same(input + other, expected)
+@pytest.mark.parametrize('input_set, other, expected', pass_testdata, indirect=['input_set'])
+def test_set_add_pass(input_set, other, expected):
+    assert_sets_same(input_set + other, expected)
 
 
-@pytest.mark.parametrize('_input, other, expected', pass_testdata)
-def test_set_iadd_pass(request, _input, other, expected):
-    input = request.getfixturevalue(_input)
-    input += other
-    assert_sets_same(input, expected)
+@pytest.mark.parametrize('input_set, other, expected', iadd_testdata, indirect=['input_set'])
+def test_set_iadd_pass(input_set, other, expected):
+    input_set += other
+    assert_sets_same(input_set, expected)
 
 
 noniterable_testdata1 = ['set1d_01', 'setNd_01']
 noniterable_testdata2 = [1, 1.9, int]
 
 
-@pytest.mark.parametrize('_input', noniterable_testdata1)
+@pytest.mark.parametrize('input_set', noniterable_testdata1, indirect=True)
 @pytest.mark.parametrize('other', noniterable_testdata2)
-def test_set_add_notiterable(request, _input, other):
-    input = request.getfixturevalue(_input)
-    with pytest.raises(TypeError), assert_not_mutated(input):
-        _ = input + other
+def test_set_add_notiterable(input_set, other):
+    with pytest.raises(TypeError), assert_not_mutated(input_set):
+        _ = input_set + other
 
 
-@pytest.mark.parametrize('_input', noniterable_testdata1)
+@pytest.mark.parametrize('input_set', noniterable_testdata1, indirect=True)
 @pytest.mark.parametrize('other', noniterable_testdata2)
-def test_set_iadd_notiterable(request, _input, other):
-    input = request.getfixturevalue(_input)
-    with pytest.raises(TypeError), assert_not_mutated(input):
-        input += other
+def test_set_iadd_notiterable(input_set, other):
+    with pytest.raises(TypeError), assert_not_mutated(input_set):
+        input_set += other
 
 
 duplicates_testdata = [
@@ -81,18 +104,16 @@ duplicates_testdata = [
 ]
 
 
-@pytest.mark.parametrize('_input, other', duplicates_testdata)
-def test_set_add_elem_duplicates(request, _input, other):
-    input = request.getfixturevalue(_input)
-    with pytest.raises(ValueError), assert_not_mutated(input):
-        _ = input + other
+@pytest.mark.parametrize('input_set, other', duplicates_testdata, indirect=['input_set'])
+def test_set_add_elem_duplicates(input_set, other):
+    with pytest.raises(ValueError), assert_not_mutated(input_set):
+        _ = input_set + other
 
 
-@pytest.mark.parametrize('_input, other', duplicates_testdata)
-def test_set_iadd_elem_duplicates(request, _input, other):
-    input = request.getfixturevalue(_input)
-    with pytest.raises(ValueError), assert_not_mutated(input):
-        input += other
+@pytest.mark.parametrize('input_set, other', duplicates_testdata, indirect=['input_set'])
+def test_set_iadd_elem_duplicates(input_set, other):
+    with pytest.raises(ValueError), assert_not_mutated(input_set):
+        input_set += other
 
 
 nonscalar_testdata = [[2, (3, 4)], [['A', 'B'], ['C', 'D']]]
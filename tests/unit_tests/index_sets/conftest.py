@@ -8,67 +8,127 @@ import pytest
 
 from opti_extensions import IndexSet1D, IndexSetND
 
+# Index-sets are built once per session for the tests that only read them; tests that mutate their
+# input must request the function-scoped `*_mut` variant defined at the bottom of this module
 
-@pytest.fixture
+
+@pytest.fixture(scope='session')
 def set1d_emp():
     return IndexSet1D()
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def set1d_0():
     return IndexSet1D([0])
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def set1d_01():
     return IndexSet1D([0, 1])
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def set1d_012():
     return IndexSet1D([0, 1, 2])
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def set1d_345():
     return IndexSet1D([3, 4, 5])
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def setNd_emp():
     return IndexSetND()
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def setNd_0():
     return IndexSetND([(0, 0)])
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def setNd_01():
     return IndexSetND([(0, 0), (0, 1)])
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def setNd_012():
     return IndexSetND([(0, 0), (0, 1), (0, 2)])
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def setNd_345():
     return IndexSetND([(0, 3), (0, 4), (0, 5)])
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def setNd_int_cmb2():
     return IndexSetND(range(2), range(2))
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def setNd_int_cmb3():
     return IndexSetND(range(2), range(2), range(2))
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def setNd_str_int_mix():
     return IndexSetND([(0, 7, 'A'), (0, 8, 'B'), (0, 9, 'B'), (1, 7, 'A'), (1, 8, 'B')])
+
+
+@pytest.fixture
+def set1d_emp_mut():
+    return IndexSet1D()
+
+
+@pytest.fixture
+def set1d_0_mut():
+    return IndexSet1D([0])
+
+
+@pytest.fixture
+def set1d_01_mut():
+    return IndexSet1D([0, 1])
+
+
+@pytest.fixture
+def set1d_012_mut():
+    return IndexSet1D([0, 1, 2])
+
+
+@pytest.fixture
+def setNd_emp_mut():
+    return IndexSetND()
+
+
+@pytest.fixture
+def setNd_0_mut():
+    return IndexSetND([(0, 0)])
+
+
+@pytest.fixture
+def setNd_01_mut():
+    return IndexSetND([(0, 0), (0, 1)])
+
+
+@pytest.fixture
+def setNd_012_mut():
+    return IndexSetND([(0, 0), (0, 1), (0, 2)])
+
+
+@pytest.fixture
+def setNd_int_cmb2_mut():
+    return IndexSetND(range(2), range(2))
+
+
+@pytest.fixture
+def input_set(request):
+    """Resolve the index-set fixture named by an indirect parametrize value."""
+    return request.getfixturevalue(request.param)
+
+
+@pytest.fixture
+def expected_set(request):
+    """Resolve the expected index-set fixture named by an indirect parametrize value."""
+    return request.getfixturevalue(request.param)
@@ -5,6 +5,7 @@
 """IndexSet1D & IndexSetND constructor."""
 
 from collections import abc
+from copy import copy
 
 import pytest
 
@@ -126,6 +127,27 @@ def test_setNd_init_elem_difflen(input):
         IndexSetND(input)
 
 
+@pytest.mark.parametrize(
+    'input, tuplelen',
+    [
+        ((range(2), range(2)), 2),
+        ((range(2), ['A', 'B'], range(3)), 3),
+        ((range(2), [(5, 5), (6, 6)]), 3),
+    ],
+)
+def test_setNd_init_product_tuplelen(input, tuplelen):
+    s = IndexSetND(*input)
+    assert s._tuplelen == tuplelen
+    with pytest.raises(ValueError):
+        s.append((0,) * (tuplelen + 1))
+
+
+@pytest.mark.parametrize('input', [(range(2), [0, 0]), (['A', 'A'], range(2), range(2))])
+def test_setNd_init_product_elem_duplicates(input):
+    with pytest.raises(ValueError):
+        IndexSetND(*input)
+
+
 @pytest.mark.parametrize(
     'input, expected',
     [
@@ -190,14 +212,41 @@ def test_set1d_init_name_update_typeerr(input):
         s.name = input
 
 
-@pytest.mark.parametrize('_input', ['set1d_012', 'setNd_012'])
-def test_set_isinstance_collections_abc(request, _input):
-    input = request.getfixturevalue(_input)
-
-    assert isinstance(input, abc.Container)
-    assert isinstance(input, abc.Iterable)
-    assert isinstance(input, abc.Reversible)
-    assert isinstance(input, abc.Sized)
-    assert isinstance(input, abc.Collection)
-    assert isinstance(input, abc.Sequence)
-    assert isinstance(input, abc.MutableSequence)
+@pytest.mark.parametrize(
+    'input, attr',
+    [
+        (IndexSet1D(), 'name'),
+        (IndexSet1D(range(3), name='ABC'), 'name'),
+        (IndexSetND(), 'names'),
+        (IndexSetND(range(2), range(2), names=['A', 'B']), 'names'),
+    ],
+)
+def test_set_copy(input, attr):
+    output = copy(input)
+
+    assert_sets_same(output, input)
+    assert getattr(output, attr) == getattr(input, attr)
+    assert output._list is not input._list
+    assert output._set is not input._set
+
+
+def test_setNd_copy_independent():
+    input = IndexSetND(range(2), range(2), names=['A', 'B'])
+    _ = input.subset(0, '*')
+    output = copy(input)
+    output.append((0, 9))
+
+    assert output.subset(0, '*') == [(0, 0), (0, 1), (0, 9)]
+    assert input.subset(0, '*') == [(0, 0), (0, 1)]
+    assert output.names is not input.names
+
+
+@pytest.mark.parametrize('input_set', ['set1d_012', 'setNd_012'], indirect=True)
+def test_set_isinstance_collections_abc(input_set):
+    assert isinstance(input_set, abc.Container)
+    assert isinstance(input_set, abc.Iterable)
+    assert isinstance(input_set, abc.Reversible)
+    assert isinstance(input_set, abc.Sized)
+    assert isinstance(input_set, abc.Collection)
+    assert isinstance(input_set, abc.Sequence)
+    assert isinstance(input_set, abc.MutableSequence)
@@ -12,7 +12,7 @@ from ..helper_indexset import assert_not_mutated, assert_sets_same
 
 
 @pytest.mark.parametrize(
-    '_input, index, expected',
+    'input_set, index, expected',
     [
         ('set1d_012', 0, 0),
         ('set1d_012', 2, 2),
@@ -23,14 +23,14 @@ from ..helper_indexset import assert_not_mutated, assert_sets_same
         ('setNd_012', -1, (0, 2)),
         ('setNd_012', -3, (0, 0)),
     ],
+    indirect=['input_set'],
 )
-def test_set_getitem_index_pass(request, _input, index, expected):
-    input = request.getfixturevalue(_input)
-    assert input[index] == expected
+def test_set_getitem_index_pass(input_set, index, expected):
+    assert input_set[index] == expected
 
 
 @pytest.mark.parametrize(
-    '_input, slice, expected',
+    'input_set, slice, expected',
     [
         ('set1d_012', slice(1, 3), [1, 2]),
         ('set1d_012', slice(3, 1), []),
@@ -51,10 +51,10 @@ def test_set_getitem_index_pass(request, _input, index, expected):
         ('setNd_012', slice(-2, None), [(0, 1), (0, 2)]),
         ('setNd_012', slice(None, -2), [(0, 0)]),
     ],
+    indirect=['input_set'],
 )
-def test_set_getitem_slice_pass(request, _input, slice, expected):
-    input = request.getfixturevalue(_input)
-    assert input[slice] == expected
+def test_set_getitem_slice_pass(input_set, slice, expected):
+    assert input_set[slice] == expected
 
 
 getitem_delitem_indexerror_testdata = [
@@ -67,115 +67,114 @@ getitem_delitem_indexerror_testdata = [
 ]
 
 
-@pytest.mark.parametrize('_input, index', getitem_delitem_indexerror_testdata)
-def test_set_getitem_indexerror(request, _input, index):
-    input = request.getfixturevalue(_input)
+@pytest.mark.parametrize(
+    'input_set, index', getitem_delitem_indexerror_testdata, indirect=['input_set']
+)
+def test_set_getitem_indexerror(input_set, index):
     with pytest.raises(IndexError):
-        input[index]
+        input_set[index]
 
 
-@pytest.mark.parametrize('_input', ['set1d_012', 'setNd_012'])
+@pytest.mark.parametrize('input_set', ['set1d_012', 'setNd_012'], indirect=True)
 @pytest.mark.parametrize('index', [0.0, 'a', int])
-def test_set_getitem_index_typeerror(request, _input, index):
-    input = request.getfixturevalue(_input)
+def test_set_getitem_index_typeerror(input_set, index):
     with pytest.raises(TypeError):
-        input[index]
+        input_set[index]
 
 
 @pytest.mark.parametrize(
-    '_input, index, value, expected',
+    'input_set, index, value, expected',
     [
-        ('set1d_012', 0, 9, IndexSet1D([9, 1, 2])),
-        ('set1d_012', 2, 9, IndexSet1D([0, 1, 9])),
-        ('set1d_012', -1, 9, IndexSet1D([0, 1, 9])),
-        ('set1d_012', -3, 9, IndexSet1D([9, 1, 2])),
-        ('setNd_012', 0, (0, 9), IndexSetND([(0, 9), (0, 1), (0, 2)])),
-        ('setNd_012', 2, (0, 9), IndexSetND([(0, 0), (0, 1), (0, 9)])),
-        ('setNd_012', -1, (0, 9), IndexSetND([(0, 0), (0, 1), (0, 9)])),
-        ('setNd_012', -3, (0, 9), IndexSetND([(0, 9), (0, 1), (0, 2)])),
+        ('set1d_012_mut', 0, 9, IndexSet1D([9, 1, 2])),
+        ('set1d_012_mut', 2, 9, IndexSet1D([0, 1, 9])),
+        ('set1d_012_mut', -1, 9, IndexSet1D([0, 1, 9])),
+        ('set1d_012_mut', -3, 9, IndexSet1D([9, 1, 2])),
+        ('setNd_012_mut', 0, (0, 9), IndexSetND([(0, 9), (0, 1), (0, 2)])),
+        ('setNd_012_mut', 2, (0, 9), IndexSetND([(0, 0), (0, 1), (0, 9)])),
+        ('setNd_012_mut', -1, (0, 9), IndexSetND([(0, 0), (0, 1), (0, 9)])),
+        ('setNd_012_mut', -3, (0, 9), IndexSetND([(0, 9), (0, 1), (0, 2)])),
     ],
+    indirect=['input_set'],
 )
-def test_set_setitem_index_pass(request, _input, index, value, expected):
-    input = request.getfixturevalue(_input)
-    input[index] = value
-    assert_sets_same(input, expected)
+def test_set_setitem_index_pass(input_set, index, value, expected):
+    input_set[index] = value
+    assert_sets_same(input_set, expected)
 
 
 @pytest.mark.parametrize(
-    '_input, index, value',
+    'input_set, index, value',
     [
         ('set1d_emp', 0, 9),
         ('set1d_012', 3, 9),
         ('set1d_012', -4, 9),
-        ('setNd_emp', 0, (0, 9)),
+        ('setNd_emp_mut', 0, (0, 9)),
         ('setNd_012', 3, (0, 9)),
         ('setNd_012', -4, (0, 9)),
     ],
+    indirect=['input_set'],
 )
-def test_set_setitem_indexerror(request, _input, index, value):
-    input = request.getfixturevalue(_input)
-    with pytest.raises(IndexError), assert_not_mutated(input):
-        input[index] = value
+def test_set_setitem_indexerror(input_set, index, value):
+    with pytest.raises(IndexError), assert_not_mutated(input_set):
+        input_set[index] = value
 
 
 @pytest.mark.parametrize(
-    '_input, slice, values, expected',
+    'input_set, slice, values, expected',
     [
-        ('set1d_012', slice(1, 3), [9], IndexSet1D([0, 9])),
-        ('set1d_012', slice(3, 1), [9], IndexSet1D([0, 1, 2, 9])),
-        ('set1d_012', slice(1, None), [9], IndexSet1D([0, 9])),
-        ('set1d_012', slice(None, 2), [9], IndexSet1D([9, 2])),
-        ('set1d_012', slice(None, None), [9], IndexSet1D([9])),
-        ('set1d_012', slice(-3, -1), [9], IndexSet1D([9, 2])),
-        ('set1d_012', slice(-1, -3), [9], IndexSet1D([0, 1, 9, 2])),
-        ('set1d_012', slice(-2, None), [9], IndexSet1D([0, 9])),
-        ('set1d_012', slice(None, -2), [9], IndexSet1D([9, 1, 2])),
-        ('set1d_emp', slice(1, 3), [9], IndexSet1D([9])),
-        ('set1d_emp', slice(3, 1), [9], IndexSet1D([9])),
-        ('set1d_emp', slice(1, None), [9], IndexSet1D([9])),
-        ('set1d_emp', slice(None, 2), [9], IndexSet1D([9])),
-        ('set1d_emp', slice(None, None), [9], IndexSet1D([9])),
-        ('set1d_emp', slice(-3, -1), [9], IndexSet1D([9])),
-        ('set1d_emp', slice(-1, -3), [9], IndexSet1D([9])),
-        ('set1d_emp', slice(-2, None), [9], IndexSet1D([9])),
-        ('set1d_emp', slice(None, -2), [9], IndexSet1D([9])),
-        ('setNd_012', slice(1, 3), [(0, 9)], IndexSetND([(0, 0), (0, 9)])),
-        ('setNd_012', slice(3, 1), [(0, 9)], IndexSetND([(0, 0), (0, 1), (0, 2), (0, 9)])),
-        ('setNd_012', slice(1, None), [(0, 9)], IndexSetND([(0, 0), (0, 9)])),
-        ('setNd_012', slice(None, 2), [(0, 9)], IndexSetND([(0, 9), (0, 2)])),
-        ('setNd_012', slice(None, None), [(0, 9)], IndexSetND([(0, 9)])),
-        ('setNd_012', slice(-3, -1), [(0, 9)], IndexSetND([(0, 9), (0, 2)])),
-        ('setNd_012', slice(-1, -3), [(0, 9)], IndexSetND([(0, 0), (0, 1), (0, 9), (0, 2)])),
-        ('setNd_012', slice(-2, None), [(0, 9)], IndexSetND([(0, 0), (0, 9)])),
-        ('setNd_012', slice(None, -2), [(0, 9)], IndexSetND([(0, 9), (0, 1), (0, 2)])),
-        ('setNd_emp', slice(1, 3), [(0, 9)], IndexSetND([(0, 9)])),
-        ('setNd_emp', slice(3, 1), [(0, 9)], IndexSetND([(0, 9)])),
-        ('setNd_emp', slice(1, None), [(0, 9)], IndexSetND([(0, 9)])),
-        ('setNd_emp', slice(None, 2), [(0, 9)], IndexSetND([(0, 9)])),
-        ('setNd_emp', slice(None, None), [(0, 9)], IndexSetND([(0, 9)])),
-        ('setNd_emp', slice(-3, -1), [(0, 9)], IndexSetND([(0, 9)])),
-        ('setNd_emp', slice(-1, -3), [(0, 9)], IndexSetND([(0, 9)])),
-        ('setNd_emp', slice(-2, None), [(0, 9)], IndexSetND([(0, 9)])),
-        ('setNd_emp', slice(None, -2), [(0, 9)], IndexSetND([(0, 9)])),
+        ('set1d_012_mut', slice(1, 3), [9], IndexSet1D([0, 9])),
+        ('set1d_012_mut', slice(3, 1), [9], IndexSet1D([0, 1, 2, 9])),
+        ('set1d_012_mut', slice(1, None), [9], IndexSet1D([0, 9])),
+        ('set1d_012_mut', slice(None, 2), [9], IndexSet1D([9, 2])),
+        ('set1d_012_mut', slice(None, None), [9], IndexSet1D([9])),
+        ('set1d_012_mut', slice(-3, -1), [9], IndexSet1D([9, 2])),
+        ('set1d_012_mut', slice(-1, -3), [9], IndexSet1D([0, 1, 9, 2])),
+        ('set1d_012_mut', slice(-2, None), [9], IndexSet1D([0, 9])),
+        ('set1d_012_mut', slice(None, -2), [9], IndexSet1D([9, 1, 2])),
+        ('set1d_emp_mut', slice(1, 3), [9], IndexSet1D([9])),
+        ('set1d_emp_mut', slice(3, 1), [9], IndexSet1D([9])),
+        ('set1d_emp_mut', slice(1, None), [9], IndexSet1D([9])),
+        ('set1d_emp_mut', slice(None, 2), [9], IndexSet1D([9])),
+        ('set1d_emp_mut', slice(None, None), [9], IndexSet1D([9])),
+        ('set1d_emp_mut', slice(-3, -1), [9], IndexSet1D([9])),
+        ('set1d_emp_mut', slice(-1, -3), [9], IndexSet1D([9])),
+        ('set1d_emp_mut', slice(-2, None), [9], IndexSet1D([9])),
+        ('set1d_emp_mut', slice(None, -2), [9], IndexSet1D([9])),
+        ('setNd_012_mut', slice(1, 3), [(0, 9)], IndexSetND([(0, 0), (0, 9)])),
+        ('setNd_012_mut', slice(3, 1), [(0, 9)], IndexSetND([(0, 0), (0, 1), (0, 2), (0, 9)])),
+        ('setNd_012_mut', slice(1, None), [(0, 9)], IndexSetND([(0, 0), (0, 9)])),
+        ('setNd_012_mut', slice(None, 2), [(0, 9)], IndexSetND([(0, 9), (0, 2)])),
+        ('setNd_012_mut', slice(None, None), [(0, 9)], IndexSetND([(0, 9)])),
+        ('setNd_012_mut', slice(-3, -1), [(0, 9)], IndexSetND([(0, 9), (0, 2)])),
+        ('setNd_012_mut', slice(-1, -3), [(0, 9)], IndexSetND([(0, 0), (0, 1), (0, 9), (0, 2)])),
+        ('setNd_012_mut', slice(-2, None), [(0, 9)], IndexSetND([(0, 0), (0, 9)])),
+        ('setNd_012_mut', slice(None, -2), [(0, 9)], IndexSetND([(0, 9), (0, 1), (0, 2)])),
+        ('setNd_emp_mut', slice(1, 3), [(0, 9)], IndexSetND([(0, 9)])),
+        ('setNd_emp_mut', slice(3, 1), [(0, 9)], IndexSetND([(0, 9)])),
+        ('setNd_emp_mut', slice(1, None), [(0, 9)], IndexSetND([(0, 9)])),
+        ('setNd_emp_mut', slice(None, 2), [(0, 9)], IndexSetND([(0, 9)])),
+        ('setNd_emp_mut', slice(None, None), [(0, 9)], IndexSetND([(0, 9)])),
+        ('setNd_emp_mut', slice(-3, -1), [(0, 9)], IndexSetND([(0, 9)])),
+        ('setNd_emp_mut', slice(-1, -3), [(0, 9)], IndexSetND([(0, 9)])),
+        ('setNd_emp_mut', slice(-2, None), [(0, 9)], IndexSetND([(0, 9)])),
+        ('setNd_emp_mut', slice(None, -2), [(0, 9)], IndexSetND([(0, 9)])),
     ],
+    indirect=['input_set'],
 )
-def test_set_setitem_slice_pass(request, _input, slice, values, expected):
-    input = request.getfixturevalue(_input)
-    input[slice] = values
-    assert_sets_same(input, expected)
+def test_set_setitem_slice_pass(input_set, slice, values, expected):
+    input_set[slice] = values
+    assert_sets_same(input_set, expected)
 
 
-@pytest.mark.parametrize('_input', ['set1d_012', 'setNd_012'])
+@pytest.mark.parametrize('input_set', ['set1d_012', 'setNd_012'], indirect=True)
 @pytest.mark.parametrize('slice', [slice(1, 3)])
 @pytest.mark.parametrize('value', [0.0, 9, int])
-def test_set_setitem_slice_value_typeerror(request, _input, slice, value):
-    input = request.getfixturevalue(_input)
-    with pytest.raises(TypeError), assert_not_mutated(input):
-        input[slice] = value
+def test_set_setitem_slice_value_typeerror(input_set, slice, value):
+    with pytest.raises(TypeError), assert_not_mutated(input_set):
+        input_set[slice] = value
 
 
 @pytest.mark.parametrize(
-    '_input, index_slice, value',
+    'input_set, index_slice, value',
     [
         ('set1d_012', 1, 0),
         ('set1d_012', 1, 0.0),
@@ -184,25 +183,25 @@ def test_set_setitem_slice_value_typeerror(request, _input, slice, value):
         ('setNd_012', 1, (0.0, 0.0)),
         ('setNd_012', slice(1, 3), [(0, 0)]),
     ],
+    indirect=['input_set'],
 )
-def test_set_setitem_elem_duplicates(request, _input, index_slice, value):
-    input = request.getfixturevalue(_input)
-    with pytest.raises(ValueError), assert_not_mutated(input):
-        input[index_slice] = value
+def test_set_setitem_elem_duplicates(input_set, index_slice, value):
+    with pytest.raises(ValueError), assert_not_mutated(input_set):
+        input_set[index_slice] = value
 
 
 @pytest.mark.parametrize(
-    '_input, value',
+    'input_set, value',
     [
         ('set1d_012', 9),
         ('setNd_012', (0, 9)),
     ],
+    indirect=['input_set'],
 )
 @pytest.mark.parametrize('index', [0.0, 'a', int])
-def test_set_setitem_index_typeerror(request, _input, index, value):
-    input = request.getfixturevalue(_input)
-    with pytest.raises(TypeError), assert_not_mutated(input):
-        input[index] = value
+def test_set_setitem_index_typeerror(input_set, index, value):
+    with pytest.raises(TypeError), assert_not_mutated(input_set):
+        input_set[index] = value
 
 
 @pytest.mark.parametrize(
@@ -230,63 +229,63 @@ def test_tupleset_setitem_elem_difflen(setNd_01, value):
 
 
 @pytest.mark.parametrize(
-    '_input, index, expected',
+    'input_set, index, expected',
     [
-        ('set1d_012', 0, IndexSet1D([1, 2])),
-        ('set1d_012', 2, IndexSet1D([0, 1])),
-        ('set1d_012', -1, IndexSet1D([0, 1])),
-        ('set1d_012', -3, IndexSet1D([1, 2])),
-        ('setNd_012', 0, IndexSetND([(0, 1), (0, 2)])),
-        ('setNd_012', 2, IndexSetND([(0, 0), (0, 1)])),
-        ('setNd_012', -1, IndexSetND([(0, 0), (0, 1)])),
-        ('setNd_012', -3, IndexSetND([(0, 1), (0, 2)])),
+        ('set1d_012_mut', 0, IndexSet1D([1, 2])),
+        ('set1d_012_mut', 2, IndexSet1D([0, 1])),
+        ('set1d_012_mut', -1, IndexSet1D([0, 1])),
+        ('set1d_012_mut', -3, IndexSet1D([1, 2])),
+        ('setNd_012_mut', 0, IndexSetND([(0, 1), (0, 2)])),
+        ('setNd_012_mut', 2, IndexSetND([(0, 0), (0, 1)])),
+        ('setNd_012_mut', -1, IndexSetND([(0, 0), (0, 1)])),
+        ('setNd_012_mut', -3, IndexSetND([(0, 1), (0, 2)])),
     ],
+    indirect=['input_set'],
 )
-def test_set_delitem_index_pass(request, _input, index, expected):
-    input = request.getfixturevalue(_input)
-    del input[index]
-    assert_sets_same(input, expected)
+def test_set_delitem_index_pass(input_set, index, expected):
+    del input_set[index]
+    assert_sets_same(input_set, expected)
 
 
 @pytest.mark.parametrize(
-    '_input, slice, expected',
+    'input_set, slice, expected',
     [
-        ('set1d_012', slice(1, 3), IndexSet1D([0])),
-        ('set1d_012', slice(3, 1), IndexSet1D([0, 1, 2])),
-        ('set1d_012', slice(1, None), IndexSet1D([0])),
-        ('set1d_012', slice(None, 2), IndexSet1D([2])),
-        ('set1d_012', slice(None, None), IndexSet1D()),
-        ('set1d_012', slice(-3, -1), IndexSet1D([2])),
-        ('set1d_012', slice(-1, -3), IndexSet1D([0, 1, 2])),
-        ('set1d_012', slice(-2, None), IndexSet1D([0])),
-        ('set1d_012', slice(None, -2), IndexSet1D([1, 2])),
-        ('setNd_012', slice(1, 3), IndexSetND([(0, 0)])),
-        ('setNd_012', slice(3, 1), IndexSetND([(0, 0), (0, 1), (0, 2)])),
-        ('setNd_012', slice(1, None), IndexSetND([(0, 0)])),
-        ('setNd_012', slice(None, 2), IndexSetND([(0, 2)])),
-        ('setNd_012', slice(None, None), IndexSetND()),
-        ('setNd_012', slice(-3, -1), IndexSetND([(0, 2)])),
-        ('setNd_012', slice(-1, -3), IndexSetND([(0, 0), (0, 1), (0, 2)])),
-        ('setNd_012', slice(-2, None), IndexSetND([(0, 0)])),
-        ('setNd_012', slice(None, -2), IndexSetND([(0, 1), (0, 2)])),
+        ('set1d_012_mut', slice(1, 3), IndexSet1D([0])),
+        ('set1d_012_mut', slice(3, 1), IndexSet1D([0, 1, 2])),
+        ('set1d_012_mut', slice(1, None), IndexSet1D([0])),
+        ('set1d_012_mut', slice(None, 2), IndexSet1D([2])),
+        ('set1d_012_mut', slice(None, None), IndexSet1D()),
+        ('set1d_012_mut', slice(-3, -1), IndexSet1D([2])),
+        ('set1d_012_mut', slice(-1, -3), IndexSet1D([0, 1, 2])),
+        ('set1d_012_mut', slice(-2, None), IndexSet1D([0])),
+        ('set1d_012_mut', slice(None, -2), IndexSet1D([1, 2])),
+        ('setNd_012_mut', slice(1, 3), IndexSetND([(0, 0)])),
+        ('setNd_012_mut', slice(3, 1), IndexSetND([(0, 0), (0, 1), (0, 2)])),
+        ('setNd_012_mut', slice(1, None), IndexSetND([(0, 0)])),
+        ('setNd_012_mut', slice(None, 2), IndexSetND([(0, 2)])),
+        ('setNd_012_mut', slice(None, None), IndexSetND()),
+        ('setNd_012_mut', slice(-3, -1), IndexSetND([(0, 2)])),
+        ('setNd_012_mut', slice(-1, -3), IndexSetND([(0, 0), (0, 1), (0, 2)])),
+        ('setNd_012_mut', slice(-2, None), IndexSetND([(0, 0)])),
+        ('setNd_012_mut', slice(None, -2), IndexSetND([(0, 1), (0, 2)])),
     ],
+    indirect=['input_set'],
 )
-def test_set_delitem_slice_pass(request, _input, slice, expected):
-    input = request.getfixturevalue(_input)
-    del input[slice]
-    assert_sets_same(input, expected)
+def test_set_delitem_slice_pass(input_set, slice, expected):
+    del input_set[slice]
+    assert_sets_same(input_set, expected)
 
 
-@pytest.mark.parametrize('_input, index', getitem_delitem_indexerror_testdata)
-def test_set_delitem_indexerror(request, _input, index):
-    input = request.getfixturevalue(_input)
-    with pytest.raises(IndexError), assert_not_mutated(input):
-        del input[index]
+@pytest.mark.parametrize(
+    'input_set, index', getitem_delitem_indexerror_testdata, indirect=['input_set']
+)
+def test_set_delitem_indexerror(input_set, index):
+    with pytest.raises(IndexError), assert_not_mutated(input_set):
+        del input_set[index]
 
 
-@pytest.mark.parametrize('_input', ['set1d_012', 'setNd_012'])
+@pytest.mark.parametrize('input_set', ['set1d_012', 'setNd_012'], indirect=True)
 @pytest.mark.parametrize('index', [0.0, 'a', int])
-def test_set_delitem_index_typeerror(request, _input, index):
-    input = request.getfixturevalue(_input)
-    with pytest.raises(TypeError), assert_not_mutated(input):
-        del input[index]
+def test_set_delitem_index_typeerror(input_set, index):
+    with pytest.raises(TypeError), assert_not_mutated(input_set):
+        del input_set[index]
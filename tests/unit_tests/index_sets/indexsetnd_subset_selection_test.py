@@ -14,7 +14,7 @@ from ..helper_indexset import assert_sets_same
 
 
 @pytest.mark.parametrize(
-    '_input, values, expected',
+    'input_set, values, expected',
     [
         ('setNd_int_cmb2', ('*', 1), [(0, 1), (1, 1)]),
         ('setNd_int_cmb2', (0, '*'), [(0, 0), (0, 1)]),
@@ -30,10 +30,10 @@ from ..helper_indexset import assert_sets_same
         ('setNd_str_int_mix', (0, '*', 'B'), [(0, 8, 'B'), (0, 9, 'B')]),
         ('setNd_str_int_mix', (0, '*', 2), []),
     ],
+    indirect=['input_set'],
 )
-def test_subset_pass(request, _input, values, expected):
-    input = request.getfixturevalue(_input)
-    assert input.subset(*values) == expected
+def test_subset_pass(input_set, values, expected):
+    assert input_set.subset(*values) == expected
 
 
 def test_subset_empty():
@@ -78,32 +78,32 @@ def expected_2():
     return defaultdict(list, {(0,): [(0, 0), (0, 1), (0, 9)], (1,): [(1, 0), (1, 1)]})
 
 
-def test_subset_w_addl_elem_append(setNd_int_cmb2, value_1, expected_1):
-    _ = setNd_int_cmb2.subset(0, '*')
-    setNd_int_cmb2.append(value_1[0])
+def test_subset_w_addl_elem_append(setNd_int_cmb2_mut, value_1, expected_1):
+    _ = setNd_int_cmb2_mut.subset(0, '*')
+    setNd_int_cmb2_mut.append(value_1[0])
 
-    assert setNd_int_cmb2.subset(0, '*') == expected_1
+    assert setNd_int_cmb2_mut.subset(0, '*') == expected_1
 
 
-def test_subset_w_addl_elem_extend(setNd_int_cmb2, value_1, expected_1):
-    _ = setNd_int_cmb2.subset(0, '*')
-    setNd_int_cmb2.extend(value_1)
+def test_subset_w_addl_elem_extend(setNd_int_cmb2_mut, value_1, expected_1):
+    _ = setNd_int_cmb2_mut.subset(0, '*')
+    setNd_int_cmb2_mut.extend(value_1)
 
-    assert setNd_int_cmb2.subset(0, '*') == expected_1
+    assert setNd_int_cmb2_mut.subset(0, '*') == expected_1
 
 
-def test_subset_w_addl_elem_add(setNd_int_cmb2, value_1, expected_1):
-    _ = setNd_int_cmb2.subset(0, '*')
-    setNd_int_cmb2 = setNd_int_cmb2 + value_1
+def test_subset_w_addl_elem_add(setNd_int_cmb2_mut, value_1, expected_1):
+    _ = setNd_int_cmb2_mut.subset(0, '*')
+    setNd_int_cmb2_mut = setNd_int_cmb2_mut + value_1
 
-    assert setNd_int_cmb2.subset(0, '*') == expected_1
+    assert setNd_int_cmb2_mut.subset(0, '*') == expected_1
 
 
-def test_subset_w_addl_elem_iadd(setNd_int_cmb2, value_1, expected_1):
-    _ = setNd_int_cmb2.subset(0, '*')
-    setNd_int_cmb2 += value_1
+def test_subset_w_addl_elem_iadd(setNd_int_cmb2_mut, value_1, expected_1):
+    _ = setNd_int_cmb2_mut.subset(0, '*')
+    setNd_int_cmb2_mut += value_1
 
-    assert setNd_int_cmb2.subset(0, '*') == expected_1
+    assert setNd_int_cmb2_mut.subset(0, '*') == expected_1
 
 
 @pytest.mark.parametrize(
@@ -115,11 +115,11 @@ def test_subset_w_addl_elem_iadd(setNd_int_cmb2, value_1, expected_1):
         [slice(1, 3), [(0, 9)], [(0, 0), (0, 9)]],
     ],
 )
-def test_subset_w_addl_elem_setitem(setNd_int_cmb2, index, value, expected):
-    _ = setNd_int_cmb2.subset(0, '*')
-    setNd_int_cmb2[index] = value
+def test_subset_w_addl_elem_setitem(setNd_int_cmb2_mut, index, value, expected):
+    _ = setNd_int_cmb2_mut.subset(0, '*')
+    setNd_int_cmb2_mut[index] = value
 
-    assert setNd_int_cmb2.subset(0, '*') == expected
+    assert setNd_int_cmb2_mut.subset(0, '*') == expected
 
 
 @pytest.mark.parametrize(
@@ -129,58 +129,72 @@ def test_subset_w_addl_elem_setitem(setNd_int_cmb2, index, value, expected):
         [5, (0, 9), [(0, 0), (0, 1), (0, 9)]],
     ],
 )
-def test_subset_w_addl_elem_insert(setNd_int_cmb2, index, value, expected):
-    _ = setNd_int_cmb2.subset(0, '*')
-    setNd_int_cmb2.insert(index, value)
+def test_subset_w_addl_elem_insert(setNd_int_cmb2_mut, index, value, expected):
+    _ = setNd_int_cmb2_mut.subset(0, '*')
+    setNd_int_cmb2_mut.insert(index, value)
 
-    assert setNd_int_cmb2.subset(0, '*') == expected
+    assert setNd_int_cmb2_mut.subset(0, '*') == expected
 
 
 @pytest.mark.parametrize(
     'index, expected',
     [[0, [(0, 1)]], [slice(0, 2), []]],
 )
-def test_subset_w_rmvd_elem_delitem(setNd_int_cmb2, index, expected):
-    _ = setNd_int_cmb2.subset(0, '*')
-    del setNd_int_cmb2[index]
+def test_subset_w_rmvd_elem_delitem(setNd_int_cmb2_mut, index, expected):
+    _ = setNd_int_cmb2_mut.subset(0, '*')
+    del setNd_int_cmb2_mut[index]
 
-    assert setNd_int_cmb2.subset(0, '*') == expected
+    assert setNd_int_cmb2_mut.subset(0, '*') == expected
 
 
-def test_subset_w_rmvd_elem_remove(setNd_int_cmb2):
+def test_subset_w_rmvd_elem_remove(setNd_int_cmb2_mut):
     value = (0, 0)
     expected = [(0, 1)]
 
-    _ = setNd_int_cmb2.subset(0, '*')
-    _ = setNd_int_cmb2.remove(value)
+    _ = setNd_int_cmb2_mut.subset(0, '*')
+    _ = setNd_int_cmb2_mut.remove(value)
 
-    assert setNd_int_cmb2.subset(0, '*') == expected
+    assert setNd_int_cmb2_mut.subset(0, '*') == expected
 
 
 @pytest.mark.parametrize(
     'index, expected',
     [[None, [(0, 0), (0, 1)]], [-3, [(0, 0)]]],
 )
-def test_subset_w_rmvd_elem_pop(setNd_int_cmb2, index, expected):
-    _ = setNd_int_cmb2.subset(0, '*')
+def test_subset_w_rmvd_elem_pop(setNd_int_cmb2_mut, index, expected):
+    _ = setNd_int_cmb2_mut.subset(0, '*')
     if index is None:
-        _ = setNd_int_cmb2.pop()
+        _ = setNd_int_cmb2_mut.pop()
     else:
-        _ = setNd_int_cmb2.pop(index)
+        _ = setNd_int_cmb2_mut.pop(index)
 
-    assert setNd_int_cmb2.subset(0, '*') == expected
+    assert setNd_int_cmb2_mut.subset(0, '*') == expected
 
 
-def test_subset_after_clear(setNd_int_cmb2):
-    _ = setNd_int_cmb2.subset(0, '*')
-    setNd_int_cmb2.clear()
+def test_subset_after_sort(setNd_int_cmb2_mut):
+    _ = setNd_int_cmb2_mut.subset(0, '*')
+    setNd_int_cmb2_mut.sort(reverse=True)
+
+    assert setNd_int_cmb2_mut.subset(0, '*') == [(0, 1), (0, 0)]
+
+
+def test_subset_after_reverse(setNd_int_cmb2_mut):
+    _ = setNd_int_cmb2_mut.subset(0, '*')
+    setNd_int_cmb2_mut.reverse()
+
+    assert setNd_int_cmb2_mut.subset(0, '*') == [(0, 1), (0, 0)]
+
+
+def test_subset_after_clear(setNd_int_cmb2_mut):
+    _ = setNd_int_cmb2_mut.subset(0, '*')
+    setNd_int_cmb2_mut.clear()
 
     with pytest.raises(LookupError):
-        setNd_int_cmb2.subset(0, '*')
+        setNd_int_cmb2_mut.subset(0, '*')
 
 
 @pytest.mark.parametrize(
-    '_input, indices, expected',
+    'input_set, indices, expected',
     [
         ('setNd_int_cmb3', (0,), IndexSet1D(range(2))),
         ('setNd_int_cmb3', (0,), IndexSet1D(range(2))),
@@ -188,10 +202,10 @@ def test_subset_after_clear(setNd_int_cmb2):
         ('setNd_str_int_mix', (0,), IndexSet1D([0, 1])),
         ('setNd_str_int_mix', (0, 2), IndexSetND([(0, 'A'), (0, 'B'), (1, 'A'), (1, 'B')])),
     ],
+    indirect=['input_set'],
 )
-def test_squeeze_pass(request, _input, indices, expected):
-    input = request.getfixturevalue(_input)
-    assert_sets_same(input.squeeze(*indices), expected)
+def test_squeeze_pass(input_set, indices, expected):
+    assert_sets_same(input_set.squeeze(*indices), expected)
 
 
 def test_squeeze_empty():
@@ -368,14 +382,28 @@ def test_squeeze_w_rmvd_elem_pop(input, index, indices, expected):
 
 @pytest.mark.parametrize('sub_val', [('*', 1), ('*', 2), (0, '*'), (2, '*')])
 @pytest.mark.parametrize('sqz_idx', [0, 1])
-def test_squeeze_after_subset(setNd_int_cmb2, sub_val, sqz_idx):
-    _ = setNd_int_cmb2.subset(*sub_val)
-    assert_sets_same(setNd_int_cmb2.squeeze(sqz_idx), IndexSet1D(range(2)))
+def test_squeeze_after_subset(setNd_int_cmb2_mut, sub_val, sqz_idx):
+    _ = setNd_int_cmb2_mut.subset(*sub_val)
+    assert_sets_same(setNd_int_cmb2_mut.squeeze(sqz_idx), IndexSet1D(range(2)))
+
+
+def test_squeeze_after_sort(setNd_int_cmb2_mut):
+    _ = setNd_int_cmb2_mut.squeeze(0)
+    setNd_int_cmb2_mut.sort(reverse=True)
+
+    assert_sets_same(setNd_int_cmb2_mut.squeeze(0), IndexSet1D([1, 0]))
+
+
+def test_squeeze_after_reverse(setNd_int_cmb2_mut):
+    _ = setNd_int_cmb2_mut.squeeze(0)
+    setNd_int_cmb2_mut.reverse()
+
+    assert_sets_same(setNd_int_cmb2_mut.squeeze(0), IndexSet1D([1, 0]))
 
 
-def test_squeeze_after_clear(setNd_int_cmb2):
-    _ = setNd_int_cmb2.squeeze(0)
-    setNd_int_cmb2.clear()
+def test_squeeze_after_clear(setNd_int_cmb2_mut):
+    _ = setNd_int_cmb2_mut.squeeze(0)
+    setNd_int_cmb2_mut.clear()
 
     with pytest.raises(LookupError):
-        setNd_int_cmb2.squeeze(0)
+        setNd_int_cmb2_mut.squeeze(0)
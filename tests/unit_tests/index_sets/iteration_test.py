@@ -8,17 +8,17 @@ import pytest
 
 
 @pytest.mark.parametrize(
-    '_input, expected',
+    'input_set, expected',
     [
         ('set1d_emp', []),
         ('set1d_012', [0, 1, 2]),
         ('setNd_emp', []),
         ('setNd_012', [(0, 0), (0, 1), (0, 2)]),
     ],
+    indirect=['input_set'],
 )
-def test_set_iter(request, _input, expected):
-    input = request.getfixturevalue(_input)
-    iterator = input.__iter__()
+def test_set_iter(input_set, expected):
+    iterator = input_set.__iter__()
     for value in expected:
         assert next(iterator) == value
     with pytest.raises(StopIteration):
@@ -26,17 +26,17 @@ def test_set_iter(request, _input, expected):
 
 
 @pytest.mark.parametrize(
-    '_input, expected',
+    'input_set, expected',
     [
         ('set1d_emp', []),
         ('set1d_012', [2, 1, 0]),
         ('setNd_emp', []),
         ('setNd_012', [(0, 2), (0, 1), (0, 0)]),
     ],
+    indirect=['input_set'],
 )
-def test_set_reversed(request, _input, expected):
-    input = request.getfixturevalue(_input)
-    rv_iterator = input.__reversed__()
+def test_set_reversed(input_set, expected):
+    rv_iterator = input_set.__reversed__()
     for value in expected:
         assert next(rv_iterator) == value
     with pytest.raises(StopIteration):
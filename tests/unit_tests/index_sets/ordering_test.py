@@ -14,15 +14,15 @@ from ..helper_indexset import assert_not_mutated, assert_sets_same
 @pytest.mark.parametrize(
     '_input, key, reverse, expected',
     [
-        ('set1d_emp', None, False, IndexSet1D()),
-        ('set1d_012', None, True, IndexSet1D([2, 1, 0])),
+        ('set1d_emp_mut', None, False, IndexSet1D()),
+        ('set1d_012_mut', None, True, IndexSet1D([2, 1, 0])),
         (IndexSet1D(['az', 'by', 'cx']), None, False, IndexSet1D(['az', 'by', 'cx'])),
         (IndexSet1D(['by', 'cx', 'az']), None, False, IndexSet1D(['az', 'by', 'cx'])),
         (IndexSet1D(['by', 'az', 'cx']), None, True, IndexSet1D(['cx', 'by', 'az'])),
         (IndexSet1D(['by', 'az', 'cx']), lambda x: x[1], False, IndexSet1D(['cx', 'by', 'az'])),
         (IndexSet1D(['by', 'az', 'cx']), lambda x: x[1], True, IndexSet1D(['az', 'by', 'cx'])),
-        ('setNd_emp', None, False, IndexSetND()),
-        ('setNd_012', lambda x: x[1], True, IndexSetND([(0, 2), (0, 1), (0, 0)])),
+        ('setNd_emp_mut', None, False, IndexSetND()),
+        ('setNd_012_mut', lambda x: x[1], True, IndexSetND([(0, 2), (0, 1), (0, 0)])),
         (IndexSetND([(0, 2), (0, 0), (0, 1)]), None, False, IndexSetND([(0, 0), (0, 1), (0, 2)])),
     ],
 )
@@ -39,6 +39,7 @@ def test_set_sort_pass(request, _input, key, reverse, expected):
     'input',
     [
         IndexSet1D([1, '2', 3]),
+        IndexSet1D([5, 4, 3, 1, 2, 9, 8, 'a', 7, 0]),
         IndexSetND([(1, 2), ('5', '6'), (3, 4)]),
     ],
 )
@@ -48,15 +49,15 @@ def test_set_sort_typeerr(input):
 
 
 @pytest.mark.parametrize(
-    '_input, expected',
+    'input_set, expected',
     [
-        ('set1d_emp', IndexSet1D()),
-        ('set1d_012', IndexSet1D([2, 1, 0])),
-        ('setNd_emp', IndexSetND()),
-        ('setNd_012', IndexSetND([(0, 2), (0, 1), (0, 0)])),
+        ('set1d_emp_mut', IndexSet1D()),
+        ('set1d_012_mut', IndexSet1D([2, 1, 0])),
+        ('setNd_emp_mut', IndexSetND()),
+        ('setNd_012_mut', IndexSetND([(0, 2), (0, 1), (0, 0)])),
     ],
+    indirect=['input_set'],
 )
-def test_set_reverse_pass(request, _input, expected):
-    input = request.getfixturevalue(_input)
-    input.reverse()
-    assert_sets_same(input, expected)
+def test_set_reverse_pass(input_set, expected):
+    input_set.reverse()
+    assert_sets_same(input_set, expected)
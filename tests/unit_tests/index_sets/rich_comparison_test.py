@@ -4,7 +4,7 @@
 
 """Rich comparison methods of IndexSet1D & IndexSetND."""
 
-from copy import deepcopy
+from copy import copy
 
 import pytest
 
@@ -20,7 +20,7 @@ from opti_extensions import IndexSet1D
 )
 def test_set_is_lt(request, _left, _right):
     left = request.getfixturevalue(_left)
-    right = request.getfixturevalue(_right) if _left != _right else deepcopy(left)
+    right = request.getfixturevalue(_right) if _left != _right else copy(left)
     assert left < right
 
 
@@ -37,7 +37,7 @@ def test_set_is_lt(request, _left, _right):
 )
 def test_set_not_lt(request, _left, _right):
     left = request.getfixturevalue(_left)
-    right = request.getfixturevalue(_right) if _left != _right else deepcopy(left)
+    right = request.getfixturevalue(_right) if _left != _right else copy(left)
     assert not left < right
 
 
@@ -54,7 +54,7 @@ def test_set_not_lt(request, _left, _right):
 )
 def test_set_is_le(request, _left, _right):
     left = request.getfixturevalue(_left)
-    right = request.getfixturevalue(_right) if _left != _right else deepcopy(left)
+    right = request.getfixturevalue(_right) if _left != _right else copy(left)
     assert left <= right
 
 
@@ -67,7 +67,7 @@ def test_set_is_le(request, _left, _right):
 )
 def test_set_not_le(request, _left, _right):
     left = request.getfixturevalue(_left)
-    right = request.getfixturevalue(_right) if _left != _right else deepcopy(left)
+    right = request.getfixturevalue(_right) if _left != _right else copy(left)
     assert not left <= right
 
 
@@ -82,10 +82,17 @@ def test_set_not_le(request, _left, _right):
 )
 def test_set_is_eq(request, _left, _right):
     left = request.getfixturevalue(_left)
-    right = request.getfixturevalue(_right) if _left != _right else deepcopy(left)
+    right = request.getfixturevalue(_right) if _left != _right else copy(left)
     assert left == right
 
 
+@pytest.mark.parametrize('_input', ['set1d_emp', 'set1d_01', 'setNd_emp', 'setNd_01'])
+def test_set_is_eq_self(request, _input):
+    input = request.getfixturevalue(_input)
+    assert input == input
+    assert not input != input
+
+
 @pytest.mark.parametrize(
     '_left, _right',
     [
@@ -97,7 +104,7 @@ def test_set_is_eq(request, _left, _right):
 )
 def test_set_not_eq(request, _left, _right):
     left = request.getfixturevalue(_left)
-    right = request.getfixturevalue(_right) if _left != _right else deepcopy(left)
+    right = request.getfixturevalue(_right) if _left != _right else copy(left)
     assert not left == right
 
 
@@ -112,7 +119,7 @@ def test_set_not_eq(request, _left, _right):
 )
 def test_set_is_ne(request, _left, _right):
     left = request.getfixturevalue(_left)
-    right = request.getfixturevalue(_right) if _left != _right else deepcopy(left)
+    right = request.getfixturevalue(_right) if _left != _right else copy(left)
     assert left != right
 
 
@@ -127,7 +134,7 @@ def test_set_is_ne(request, _left, _right):
 )
 def test_set_not_ne(request, _left, _right):
     left = request.getfixturevalue(_left)
-    right = request.getfixturevalue(_right) if _left != _right else deepcopy(left)
+    right = request.getfixturevalue(_right) if _left != _right else copy(left)
     assert not left != right
 
 
@@ -140,7 +147,7 @@ def test_set_not_ne(request, _left, _right):
 )
 def test_set_is_gt(request, _left, _right):
     left = request.getfixturevalue(_left)
-    right = request.getfixturevalue(_right) if _left != _right else deepcopy(left)
+    right = request.getfixturevalue(_right) if _left != _right else copy(left)
     assert left > right
 
 
@@ -157,7 +164,7 @@ def test_set_is_gt(request, _left, _right):
 )
 def test_set_not_gt(request, _left, _right):
     left = request.getfixturevalue(_left)
-    right = request.getfixturevalue(_right) if _left != _right else deepcopy(left)
+    right = request.getfixturevalue(_right) if _left != _right else copy(left)
     assert not left > right
 
 
@@ -174,7 +181,7 @@ def test_set_not_gt(request, _left, _right):
 )
 def test_set_is_ge(request, _left, _right):
     left = request.getfixturevalue(_left)
-    right = request.getfixturevalue(_right) if _left != _right else deepcopy(left)
+    right = request.getfixturevalue(_right) if _left != _right else copy(left)
     assert left >= right
 
 
@@ -187,29 +194,26 @@ def test_set_is_ge(request, _left, _right):
 )
 def test_set_not_ge(request, _left, _right):
     left = request.getfixturevalue(_left)
-    right = request.getfixturevalue(_right) if _left != _right else deepcopy(left)
+    right = request.getfixturevalue(_right) if _left != _right else copy(left)
     assert not left >= right
 
 
-@pytest.mark.parametrize(
-    'sym_opr',
-    ['__lt__', '__le__', '__eq__', '__ne__', '__gt__', '__ge__'],
-)
-@pytest.mark.parametrize(
-    '_left, right',
-    [
-        ('set1d_01', [0, 1]),
-        ('set1d_01', (0, 1)),
-        ('set1d_01', {0, 1}),
-        ('setNd_01', [(0, 0), (0, 1)]),
-        ('setNd_01', ((0, 0), (0, 1))),
-        ('setNd_01', {(0, 0), (0, 1)}),
-    ],
-)
-def test_set_sym_opr_invalid(request, _left, sym_opr, right):
-    left = request.getfixturevalue(_left)
-    with pytest.raises(TypeError):
-        getattr(left, sym_opr)(right)
+def test_set_sym_opr_invalid(set1d_01, setNd_01):
+    cases = [
+        (set1d_01, [0, 1]),
+        (set1d_01, (0, 1)),
+        (set1d_01, {0, 1}),
+        (setNd_01, [(0, 0), (0, 1)]),
+        (setNd_01, ((0, 0), (0, 1))),
+        (setNd_01, {(0, 0), (0, 1)}),
+    ]
+    for left, right in cases:
+        for sym_opr in ['__lt__', '__le__', '__eq__', '__ne__', '__gt__', '__ge__']:
+            try:
+                getattr(left, sym_opr)(right)
+            except TypeError:
+                continue
+            pytest.fail(f'{type(left).__name__}.{sym_opr}({right!r}) did not raise TypeError')
 
 
 @pytest.mark.parametrize(
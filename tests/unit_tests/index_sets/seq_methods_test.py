@@ -4,39 +4,55 @@
 
 """Sequence methods of IndexSet1D & IndexSetND."""
 
+from itertools import product
+
 import pytest
 
 from opti_extensions import IndexSet1D, IndexSetND
 
 from ..helper_indexset import assert_not_mutated, assert_sets_same
 
+# Index-sets shared by several parametrize rows are built once at import and never mutated
+SET1D_01_9FLT = IndexSet1D([0, 1, 9.0])
+SETND_01_9FLT = IndexSetND([(0, 0), (0, 1), (0.0, 9.0)])
+SET1D_89 = IndexSet1D([8, 9])
+SET1D_0189 = IndexSet1D([0, 1, 8, 9])
+SETND_89 = IndexSetND([(0, 8), (0, 9)])
+SETND_0189 = IndexSetND([(0, 0), (0, 1), (0, 8), (0, 9)])
+SET1D_9012 = IndexSet1D([9, 0, 1, 2])
+SET1D_0192 = IndexSet1D([0, 1, 9, 2])
+SETND_9012 = IndexSetND([(0, 9), (0, 0), (0, 1), (0, 2)])
+SETND_0192 = IndexSetND([(0, 0), (0, 1), (0, 9), (0, 2)])
+SET1D_12 = IndexSet1D([1, 2])
+SETND_12 = IndexSetND([(0, 1), (0, 2)])
+
 
 @pytest.mark.parametrize(
-    '_input, value',
+    'input_set, value',
     [
         ('set1d_012', 0),
         ('setNd_012', (0, 0)),
     ],
+    indirect=['input_set'],
 )
-def test_set_contains(request, _input, value):
-    input = request.getfixturevalue(_input)
-    assert value in input
+def test_set_contains(input_set, value):
+    assert value in input_set
 
 
 @pytest.mark.parametrize(
-    '_input, value',
+    'input_set, value',
     [
         ('set1d_012', 9),
         ('setNd_012', (0, 9)),
     ],
+    indirect=['input_set'],
 )
-def test_set_contains_not(request, _input, value):
-    input = request.getfixturevalue(_input)
-    assert value not in input
+def test_set_contains_not(input_set, value):
+    assert value not in input_set
 
 
 @pytest.mark.parametrize(
-    '_input, expected',
+    'input_set, expected',
     [
         ('set1d_emp', 0),
         ('set1d_0', 1),
@@ -45,73 +61,73 @@ def test_set_contains_not(request, _input, value):
         ('setNd_0', 1),
         ('setNd_012', 3),
     ],
+    indirect=['input_set'],
 )
-def test_set_len(request, _input, expected):
-    input = request.getfixturevalue(_input)
-    assert len(input) == expected
+def test_set_len(input_set, expected):
+    assert len(input_set) == expected
 
 
 @pytest.mark.parametrize(
-    '_input, elem, expected',
+    'input_set, elem, expected',
     [
         ('set1d_012', 0, 0),
         ('set1d_012', 2, 2),
         ('setNd_012', (0, 0), 0),
         ('setNd_012', (0, 2), 2),
     ],
+    indirect=['input_set'],
 )
-def test_set_index_pass(request, _input, elem, expected):
-    input = request.getfixturevalue(_input)
-    assert input.index(elem) == expected
+def test_set_index_pass(input_set, elem, expected):
+    assert input_set.index(elem) == expected
 
 
 @pytest.mark.parametrize(
-    '_input, elem',
+    'input_set, elem',
     [
         ('set1d_emp', 0),
         ('set1d_012', -1),
         ('setNd_emp', (0, 0)),
         ('setNd_012', (0, -1)),
     ],
+    indirect=['input_set'],
 )
-def test_set_index_valueerror(request, _input, elem):
-    input = request.getfixturevalue(_input)
+def test_set_index_valueerror(input_set, elem):
     with pytest.raises(ValueError):
-        input.index(elem)
+        input_set.index(elem)
 
 
 @pytest.mark.parametrize(
-    '_input, value, expected',
+    'input_set, value, expected',
     [
-        ('set1d_emp', 9, IndexSet1D([9])),
-        ('set1d_01', 9, IndexSet1D([0, 1, 9])),
-        ('set1d_01', 'A', IndexSet1D([0, 1, 'A'])),
-        ('set1d_01', 9.0, IndexSet1D([0, 1, 9.0])),
-        ('setNd_emp', (0, 9), IndexSetND([(0, 9)])),
-        ('setNd_01', (0, 9), IndexSetND([(0, 0), (0, 1), (0, 9)])),
-        ('setNd_01', ('A', 'B'), IndexSetND([(0, 0), (0, 1), ('A', 'B')])),
-        ('setNd_01', (0.0, 9.0), IndexSetND([(0, 0), (0, 1), (0.0, 9.0)])),
+        ('set1d_emp_mut', 9, IndexSet1D([9])),
+        ('set1d_01_mut', 9, IndexSet1D([0, 1, 9])),
+        ('set1d_01_mut', 'A', IndexSet1D([0, 1, 'A'])),
+        ('set1d_01_mut', 9.0, SET1D_01_9FLT),
+        ('setNd_emp_mut', (0, 9), IndexSetND([(0, 9)])),
+        ('setNd_01_mut', (0, 9), IndexSetND([(0, 0), (0, 1), (0, 9)])),
+        ('setNd_01_mut', ('A', 'B'), IndexSetND([(0, 0), (0, 1), ('A', 'B')])),
+        ('setNd_01_mut', (0.0, 9.0), SETND_01_9FLT),
     ],
+    indirect=['input_set'],
 )
-def test_set_append_pass(request, _input, value, expected):
-    input = request.getfixturevalue(_input)
-    input.append(value)
-    assert_sets_same(input, expected)
+def test_set_append_pass(input_set, value, expected):
+    input_set.append(value)
+    assert_sets_same(input_set, expected)
 
 
 @pytest.mark.parametrize(
-    '_input, value',
+    'input_set, value',
     [
         ('set1d_012', 0),
         ('set1d_012', 0.0),
         ('setNd_012', (0, 0)),
         ('setNd_012', (0.0, 0.0)),
     ],
+    indirect=['input_set'],
 )
-def test_set_append_elem_duplicates(request, _input, value):
-    input = request.getfixturevalue(_input)
-    with pytest.raises(ValueError), assert_not_mutated(input):
-        input.append(value)
+def test_set_append_elem_duplicates(input_set, value):
+    with pytest.raises(ValueError), assert_not_mutated(input_set):
+        input_set.append(value)
 
 
 @pytest.mark.parametrize(
@@ -139,63 +155,64 @@ def test_tupleset_append_elem_difflen(setNd_01, value):
 
 
 @pytest.mark.parametrize(
-    '_input, values, expected',
+    'input_set, values, expected',
     [
-        ('set1d_emp', [8, 9], IndexSet1D([8, 9])),
-        ('set1d_01', [8, 9], IndexSet1D([0, 1, 8, 9])),
-        ('set1d_emp', IndexSet1D([8, 9]), IndexSet1D([8, 9])),
-        ('set1d_01', IndexSet1D([8, 9]), IndexSet1D([0, 1, 8, 9])),
-        ('set1d_emp', (8, 9), IndexSet1D([8, 9])),
-        ('set1d_01', (8, 9), IndexSet1D([0, 1, 8, 9])),
-        ('set1d_emp', {8, 9}, IndexSet1D([8, 9])),
-        ('set1d_01', {8, 9}, IndexSet1D([0, 1, 8, 9])),
-        ('set1d_01', 'ABC', IndexSet1D([0, 1, 'A', 'B', 'C'])),
-        ('set1d_01', [9.0], IndexSet1D([0, 1, 9.0])),
-        ('setNd_emp', IndexSetND([(0, 8), (0, 9)]), IndexSetND([(0, 8), (0, 9)])),
-        ('setNd_01', IndexSetND([(0, 8), (0, 9)]), IndexSetND([(0, 0), (0, 1), (0, 8), (0, 9)])),
-        ('setNd_emp', [(0, 8), (0, 9)], IndexSetND([(0, 8), (0, 9)])),
-        ('setNd_01', [(0, 8), (0, 9)], IndexSetND([(0, 0), (0, 1), (0, 8), (0, 9)])),
-        ('setNd_emp', ((0, 8), (0, 9)), IndexSetND([(0, 8), (0, 9)])),
-        ('setNd_01', ((0, 8), (0, 9)), IndexSetND([(0, 0), (0, 1), (0, 8), (0, 9)])),
-        ('setNd_emp', {(0, 8), (0, 9)}, IndexSetND([(0, 8), (0, 9)])),
-        ('setNd_01', {(0, 8), (0, 9)}, IndexSetND([(0, 0), (0, 1), (0, 8), (0, 9)])),
+        ('set1d_emp_mut', [8, 9], SET1D_89),
+        ('set1d_01_mut', [8, 9], SET1D_0189),
+        ('set1d_emp_mut', SET1D_89, SET1D_89),
+        ('set1d_01_mut', SET1D_89, SET1D_0189),
+        ('set1d_emp_mut', (8, 9), SET1D_89),
+        ('set1d_01_mut', (8, 9), SET1D_0189),
+        ('set1d_emp_mut', {8, 9}, SET1D_89),
+        ('set1d_01_mut', {8, 9}, SET1D_0189),
+        ('set1d_01_mut', 'ABC', IndexSet1D([0, 1, 'A', 'B', 'C'])),
+        ('set1d_01_mut', [9.0], SET1D_01_9FLT),
+        ('setNd_emp_mut', SETND_89, SETND_89),
+        ('setNd_01_mut', SETND_89, SETND_0189),
+        ('setNd_emp_mut', [(0, 8), (0, 9)], SETND_89),
+        ('setNd_01_mut', [(0, 8), (0, 9)], SETND_0189),
+        ('setNd_emp_mut', ((0, 8), (0, 9)), SETND_89),
+        ('setNd_01_mut', ((0, 8), (0, 9)), SETND_0189),
+        ('setNd_emp_mut', {(0, 8), (0, 9)}, SETND_89),
+        ('setNd_01_mut', {(0, 8), (0, 9)}, SETND_0189),
         (
-            'setNd_01',
+            'setNd_01_mut',
             [('A', 'B'), ('C', 'D')],
             IndexSetND([(0, 0), (0, 1), ('A', 'B'), ('C', 'D')]),
         ),
-        ('setNd_01', [(0.0, 9.0)], IndexSetND([(0, 0), (0, 1), (0.0, 9.0)])),
+        ('setNd_01_mut', [(0.0, 9.0)], SETND_01_9FLT),
     ],
+    indirect=['input_set'],
 )
-def test_set_extend_pass(request, _input, values, expected):
-    input = request.getfixturevalue(_input)
-    input.extend(values)
-    assert_sets_same(input, expected)
+def test_set_extend_pass(input_set, values, expected):
+    input_set.extend(values)
+    assert_sets_same(input_set, expected)
 
 
-@pytest.mark.parametrize('_input', ['set1d_01', 'setNd_01'])
+@pytest.mark.parametrize('input_set', ['set1d_01', 'setNd_01'], indirect=True)
 @pytest.mark.parametrize('values', [1, 1.9, int])
-def test_set_extend_noniterable(request, _input, values):
-    input = request.getfixturevalue(_input)
-    with pytest.raises(TypeError), assert_not_mutated(input):
-        input.extend(values)
+def test_set_extend_noniterable(input_set, values):
+    with pytest.raises(TypeError), assert_not_mutated(input_set):
+        input_set.extend(values)
 
 
 @pytest.mark.parametrize(
-    '_input, values',
+    'input_set, values',
     [
         ('set1d_012', IndexSet1D([0, 9])),
         ('set1d_012', [0, 9]),
         ('set1d_012', [0.0, 9]),
+        ('set1d_012', [9, 9]),
         ('setNd_012', IndexSetND([(0, 0), (9, 9)])),
         ('setNd_012', [(0, 0), (9, 9)]),
         ('setNd_012', [(0.0, 0.0), (9, 9)]),
+        ('setNd_012', [(9, 9), (9, 9)]),
     ],
+    indirect=['input_set'],
 )
-def test_set_extend_elem_duplicates(request, _input, values):
-    input = request.getfixturevalue(_input)
-    with pytest.raises(ValueError), assert_not_mutated(input):
-        input.extend(values)
+def test_set_extend_elem_duplicates(input_set, values):
+    with pytest.raises(ValueError), assert_not_mutated(input_set):
+        input_set.extend(values)
 
 
 @pytest.mark.parametrize(
@@ -237,55 +254,56 @@ def test_tupleset_extend_elem_difflen(setNd_01, value):
 
 
 @pytest.mark.parametrize(
-    '_input, index, value, expected',
+    'input_set, index, value, expected',
     [
-        ('set1d_012', 0, 9, IndexSet1D([9, 0, 1, 2])),
-        ('set1d_012', 2, 9, IndexSet1D([0, 1, 9, 2])),
-        ('set1d_012', -1, 9, IndexSet1D([0, 1, 9, 2])),
-        ('set1d_012', -3, 9, IndexSet1D([9, 0, 1, 2])),
-        ('set1d_012', 9, 9, IndexSet1D([0, 1, 2, 9])),
-        ('set1d_012', -9, 9, IndexSet1D([9, 0, 1, 2])),
-        ('setNd_012', 0, (0, 9), IndexSetND([(0, 9), (0, 0), (0, 1), (0, 2)])),
-        ('setNd_012', 2, (0, 9), IndexSetND([(0, 0), (0, 1), (0, 9), (0, 2)])),
-        ('setNd_012', -1, (0, 9), IndexSetND([(0, 0), (0, 1), (0, 9), (0, 2)])),
-        ('setNd_012', -3, (0, 9), IndexSetND([(0, 9), (0, 0), (0, 1), (0, 2)])),
-        ('setNd_012', 9, (0, 9), IndexSetND([(0, 0), (0, 1), (0, 2), (0, 9)])),
-        ('setNd_012', -9, (0, 9), IndexSetND([(0, 9), (0, 0), (0, 1), (0, 2)])),
+        ('set1d_012_mut', 0, 9, SET1D_9012),
+        ('set1d_012_mut', 2, 9, SET1D_0192),
+        ('set1d_012_mut', -1, 9, SET1D_0192),
+        ('set1d_012_mut', -3, 9, SET1D_9012),
+        ('set1d_012_mut', 9, 9, IndexSet1D([0, 1, 2, 9])),
+        ('set1d_012_mut', -9, 9, SET1D_9012),
+        ('setNd_012_mut', 0, (0, 9), SETND_9012),
+        ('setNd_012_mut', 2, (0, 9), SETND_0192),
+        ('setNd_012_mut', -1, (0, 9), SETND_0192),
+        ('setNd_012_mut', -3, (0, 9), SETND_9012),
+        ('setNd_012_mut', 9, (0, 9), IndexSetND([(0, 0), (0, 1), (0, 2), (0, 9)])),
+        ('setNd_012_mut', -9, (0, 9), SETND_9012),
     ],
+    indirect=['input_set'],
 )
-def test_set_insert_pass(request, _input, index, value, expected):
-    input = request.getfixturevalue(_input)
-    input.insert(index, value)
-    assert_sets_same(input, expected)
+def test_set_insert_pass(input_set, index, value, expected):
+    input_set.insert(index, value)
+    assert_sets_same(input_set, expected)
 
 
 @pytest.mark.parametrize(
-    '_input, index, value',
+    'input_set, index, value',
     [
         ('set1d_012', 1, 0),
         ('set1d_012', 1, 0.0),
         ('setNd_012', 1, (0, 0)),
         ('setNd_012', 1, (0.0, 0.0)),
     ],
+    indirect=['input_set'],
 )
-def test_set_insert_elem_duplicates(request, _input, index, value):
-    input = request.getfixturevalue(_input)
-    with pytest.raises(ValueError), assert_not_mutated(input):
-        input.insert(index, value)
+def test_set_insert_elem_duplicates(input_set, index, value):
+    with pytest.raises(ValueError), assert_not_mutated(input_set):
+        input_set.insert(index, value)
 
 
 @pytest.mark.parametrize(
-    '_input, value',
+    'input_set, value, index',
     [
-        ('set1d_012', 9),
-        ('setNd_012', (0, 9)),
+        (_input, value, index)
+        for (_input, value), index in product(
+            [('set1d_012', 9), ('setNd_012', (0, 9))], [0.0, 'a', int]
+        )
     ],
+    indirect=['input_set'],
 )
-@pytest.mark.parametrize('index', [0.0, 'a', int])
-def test_set_insert_index_typeerror(request, _input, index, value):
-    input = request.getfixturevalue(_input)
-    with pytest.raises(TypeError), assert_not_mutated(input):
-        input.insert(index, value)
+def test_set_insert_index_typeerror(input_set, index, value):
+    with pytest.raises(TypeError), assert_not_mutated(input_set):
+        input_set.insert(index, value)
 
 
 @pytest.mark.parametrize(
@@ -313,57 +331,57 @@ def test_tupleset_insert_elem_difflen(setNd_01, value):
 
 
 @pytest.mark.parametrize(
-    '_input, value, expected',
+    'input_set, value, expected',
     [
-        ('set1d_0', 0, IndexSet1D()),
-        ('set1d_012', 0, IndexSet1D([1, 2])),
-        ('set1d_012', 0.0, IndexSet1D([1, 2])),
-        ('set1d_012', 2, IndexSet1D([0, 1])),
-        ('setNd_0', (0, 0), IndexSetND()),
-        ('setNd_012', (0, 0), IndexSetND([(0, 1), (0, 2)])),
-        ('setNd_012', (0.0, 0.0), IndexSetND([(0, 1), (0, 2)])),
-        ('setNd_012', (0, 2), IndexSetND([(0, 0), (0, 1)])),
+        ('set1d_0_mut', 0, IndexSet1D()),
+        ('set1d_012_mut', 0, SET1D_12),
+        ('set1d_012_mut', 0.0, SET1D_12),
+        ('set1d_012_mut', 2, IndexSet1D([0, 1])),
+        ('setNd_0_mut', (0, 0), IndexSetND()),
+        ('setNd_012_mut', (0, 0), SETND_12),
+        ('setNd_012_mut', (0.0, 0.0), SETND_12),
+        ('setNd_012_mut', (0, 2), IndexSetND([(0, 0), (0, 1)])),
     ],
+    indirect=['input_set'],
 )
-def test_set_remove_pass(request, _input, value, expected):
-    input = request.getfixturevalue(_input)
-    input.remove(value)
-    assert_sets_same(input, expected)
+def test_set_remove_pass(input_set, value, expected):
+    input_set.remove(value)
+    assert_sets_same(input_set, expected)
 
 
 @pytest.mark.parametrize(
-    '_input, value',
+    'input_set, value',
     [
         ('set1d_012', 9),
         ('set1d_012', 'abc'),
         ('setNd_012', (0, 9)),
         ('setNd_012', (0, 0, 0)),
     ],
+    indirect=['input_set'],
 )
-def test_set_remove_valueerr(request, _input, value):
-    input = request.getfixturevalue(_input)
-    with pytest.raises(ValueError), assert_not_mutated(input):
-        input.remove(value)
+def test_set_remove_valueerr(input_set, value):
+    with pytest.raises(ValueError), assert_not_mutated(input_set):
+        input_set.remove(value)
 
 
 @pytest.mark.parametrize(
-    '_input, index, expected',
+    'input_set, index, expected',
     [
-        ('set1d_012', 0, 0),
-        ('set1d_012', -1, 2),
-        ('set1d_012', 1, 1),
-        ('setNd_012', 0, (0, 0)),
-        ('setNd_012', -1, (0, 2)),
-        ('setNd_012', 1, (0, 1)),
+        ('set1d_012_mut', 0, 0),
+        ('set1d_012_mut', -1, 2),
+        ('set1d_012_mut', 1, 1),
+        ('setNd_012_mut', 0, (0, 0)),
+        ('setNd_012_mut', -1, (0, 2)),
+        ('setNd_012_mut', 1, (0, 1)),
     ],
+    indirect=['input_set'],
 )
-def test_set_pop_pass(request, _input, index, expected):
-    input = request.getfixturevalue(_input)
-    assert expected == input.pop(index)
+def test_set_pop_pass(input_set, index, expected):
+    assert expected == input_set.pop(index)
 
 
 @pytest.mark.parametrize(
-    '_input, index',
+    'input_set, index',
     [
         ('set1d_emp', 0),
         ('set1d_012', 3),
@@ -372,24 +390,23 @@ def test_set_pop_pass(request, _input, index, expected):
         ('setNd_012', 3),
         ('setNd_012', -4),
     ],
+    indirect=['input_set'],
 )
-def test_set_pop_indexerr(request, _input, index):
-    input = request.getfixturevalue(_input)
-    with pytest.raises(IndexError), assert_not_mutated(input):
-        _value = input.pop(index)
+def test_set_pop_indexerr(input_set, index):
+    with pytest.raises(IndexError), assert_not_mutated(input_set):
+        _value = input_set.pop(index)
 
 
 @pytest.mark.parametrize(
-    '_input, _expected',
+    'input_set, expected_set',
     [
-        ('set1d_emp', 'set1d_emp'),
-        ('set1d_012', 'set1d_emp'),
-        ('setNd_emp', 'setNd_emp'),
-        ('setNd_012', 'setNd_emp'),
+        ('set1d_emp_mut', 'set1d_emp'),
+        ('set1d_012_mut', 'set1d_emp'),
+        ('setNd_emp_mut', 'setNd_emp'),
+        ('setNd_012_mut', 'setNd_emp'),
     ],
+    indirect=['input_set', 'expected_set'],
 )
-def test_set_clear_output_pass(request, _input, _expected):
-    input = request.getfixturevalue(_input)
-    expected = request.getfixturevalue(_expected)
-    input.clear()
-    assert_sets_same(input, expected)
+def test_set_clear_output_pass(input_set, expected_set):
+    input_set.clear()
+    assert_sets_same(input_set, expected_set)
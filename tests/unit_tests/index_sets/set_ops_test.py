@@ -4,6 +4,10 @@
 
 """Set operation methods of IndexSet1D & IndexSetND."""
 
+import operator
+from collections import namedtuple
+from copy import copy
+
 import pytest
 
 from opti_extensions import IndexSet1D, IndexSetND
@@ -11,32 +15,55 @@ from opti_extensions import IndexSet1D, IndexSetND
 from ..helper_indexset import assert_not_mutated
 
 
-@pytest.mark.parametrize('cls', ['IS', list, set, dict.fromkeys])
-@pytest.mark.parametrize(
-    '_input, _other, expected',
-    [
+@pytest.fixture
+def other_as(request):
+    """Resolve the other index-set once per test, optionally coerced to a plain iterable."""
+    _other, cls = request.param
+    other = request.getfixturevalue(_other)
+    return other if cls == 'IS' else cls(other)
+
+
+disjoint_test_cases = [
+    (_input, (_other, cls), expected)
+    for _input, _other, expected in [
         ('set1d_emp', 'set1d_01', True),
         ('set1d_0', 'set1d_01', False),
         ('set1d_345', 'set1d_01', True),
         ('setNd_emp', 'setNd_01', True),
         ('setNd_0', 'setNd_01', False),
         ('setNd_345', 'setNd_01', True),
+    ]
+    for cls in ['IS', list, set, dict.fromkeys]
+]
+
+
+@pytest.mark.parametrize(
+    'input_set, other_as, expected',
+    disjoint_test_cases,
+    indirect=['input_set', 'other_as'],
+    ids=[
+        f'{_input}-{_other}-{getattr(cls, "__name__", cls)}'
+        for _input, (_other, cls), _ in disjoint_test_cases
     ],
 )
-def test_set_disjoint_pass(cls, request, _input, _other, expected):
-    input, other = request.getfixturevalue(_input), request.getfixturevalue(_other)
-    if cls != 'IS':
-        other = cls(other)
-    assert input.isdisjoint(other) is expected
+def test_set_disjoint_pass(input_set, other_as, expected):
+    assert input_set.isdisjoint(other_as) is expected
 
 
-@pytest.mark.parametrize('_input', ['set1d_emp', 'setNd_emp', 'set1d_0', 'setNd_0'])
+@pytest.mark.parametrize(
+    'input_set',
+    ['set1d_emp', 'setNd_emp', 'set1d_0', 'setNd_0'],
+    indirect=True,
+)
 @pytest.mark.parametrize('other', [0.0, 123, None])
-def test_set_disjoint_typerr(request, _input, other):
-    input = request.getfixturevalue(_input)
+def test_set_disjoint_typerr(input_set, other):
     with pytest.raises(TypeError):
-        input.isdisjoint(other)
+        input_set.isdisjoint(other)
+
 
+# Index-sets shared by several parametrize rows are built once at import and never mutated
+SET1D_01345 = IndexSet1D([0, 1, 3, 4, 5])
+SETND_01345 = IndexSetND([(0, 0), (0, 1), (0, 3), (0, 4), (0, 5)])
 
 set_op_test_cases = [
     ('set1d_emp', 'set1d_01', 'set1d_01', 'set1d_emp', 'set1d_emp', 'set1d_01'),
@@ -45,10 +72,10 @@ set_op_test_cases = [
     (
         'set1d_345',
         'set1d_01',
-        IndexSet1D([0, 1, 3, 4, 5]),
+        SET1D_01345,
         'set1d_emp',
         'set1d_345',
-        IndexSet1D([0, 1, 3, 4, 5]),
+        SET1D_01345,
     ),
     ('set1d_345', 'set1d_emp', 'set1d_345', 'set1d_emp', 'set1d_345', 'set1d_345'),
     ('setNd_emp', 'setNd_01', 'setNd_01', 'setNd_emp', 'setNd_emp', 'setNd_01'),
@@ -57,166 +84,72 @@ set_op_test_cases = [
     (
         'setNd_345',
         'setNd_01',
-        IndexSetND([(0, 0), (0, 1), (0, 3), (0, 4), (0, 5)]),
+        SETND_01345,
         'setNd_emp',
         'setNd_345',
-        IndexSetND([(0, 0), (0, 1), (0, 3), (0, 4), (0, 5)]),
+        SETND_01345,
     ),
     ('setNd_345', 'setNd_emp', 'setNd_345', 'setNd_emp', 'setNd_345', 'setNd_345'),
 ]
 
 
-@pytest.mark.parametrize('cls', ['IS', list, set, dict.fromkeys])
-@pytest.mark.parametrize(
-    '_input, _other, _exp_union, _exp_intscn, _exp_diff, _exp_symdiff', set_op_test_cases
+SetOpCase = namedtuple(
+    'SetOpCase', ['input', 'other', 'exp_union', 'exp_intscn', 'exp_diff', 'exp_symdiff']
 )
-def test_set_methods(
-    request, cls, _input, _other, _exp_union, _exp_intscn, _exp_diff, _exp_symdiff
-):
-    input, other = request.getfixturevalue(_input), request.getfixturevalue(_other)
-    if cls != 'IS':
-        other = cls(other)
-
-    exp_union = request.getfixturevalue(_exp_union) if isinstance(_exp_union, str) else _exp_union
-    exp_intscn = (
-        request.getfixturevalue(_exp_intscn) if isinstance(_exp_intscn, str) else _exp_intscn
-    )
-    exp_diff = request.getfixturevalue(_exp_diff) if isinstance(_exp_diff, str) else _exp_diff
-    exp_symdiff = (
-        request.getfixturevalue(_exp_symdiff) if isinstance(_exp_symdiff, str) else _exp_symdiff
-    )
 
-    assert input.union(other) == exp_union
-    assert input.intersection(other) == exp_intscn
-    assert input.difference(other) == exp_diff
-    assert input.symmetric_difference(other) == exp_symdiff
 
-    name_attr = 'name' if isinstance(input, IndexSet1D) else 'names'
-
-    assert getattr(input.union(other), name_attr) == getattr(exp_union, name_attr)
-    assert getattr(input.intersection(other), name_attr) == getattr(exp_intscn, name_attr)
-    assert getattr(input.difference(other), name_attr) == getattr(exp_diff, name_attr)
-    assert getattr(input.symmetric_difference(other), name_attr) == getattr(exp_symdiff, name_attr)
-
-
-@pytest.mark.parametrize(
-    '_input, _other, _exp_union, _exp_intscn, _exp_diff, _exp_symdiff', set_op_test_cases
-)
-def test_set_operators_pass(
-    request, _input, _other, _exp_union, _exp_intscn, _exp_diff, _exp_symdiff
-):
-    input, other = request.getfixturevalue(_input), request.getfixturevalue(_other)
-    exp_union = request.getfixturevalue(_exp_union) if isinstance(_exp_union, str) else _exp_union
-    exp_intscn = (
-        request.getfixturevalue(_exp_intscn) if isinstance(_exp_intscn, str) else _exp_intscn
-    )
-    exp_diff = request.getfixturevalue(_exp_diff) if isinstance(_exp_diff, str) else _exp_diff
-    exp_symdiff = (
-        request.getfixturevalue(_exp_symdiff) if isinstance(_exp_symdiff, str) else _exp_symdiff
+@pytest.fixture
+def op_case(request):
+    """Resolve the fixture names in a row of `set_op_test_cases` once per test."""
+    return SetOpCase(
+        *(request.getfixturevalue(x) if isinstance(x, str) else x for x in request.param)
     )
 
-    assert input | other == exp_union
-    assert input & other == exp_intscn
-    assert input - other == exp_diff
-    assert input ^ other == exp_symdiff
 
+SET_OPS = {
+    'method_union': lambda a, b: a.union(b),
+    'method_intscn': lambda a, b: a.intersection(b),
+    'method_diff': lambda a, b: a.difference(b),
+    'method_symdiff': lambda a, b: a.symmetric_difference(b),
+    'operator_union': operator.or_,
+    'operator_intscn': operator.and_,
+    'operator_diff': operator.sub,
+    'operator_symdiff': operator.xor,
+    'inplace_union': operator.ior,
+    'inplace_intscn': operator.iand,
+    'inplace_diff': operator.isub,
+    'inplace_symdiff': operator.ixor,
+}
+
+
+@pytest.mark.parametrize('op_case', set_op_test_cases, indirect=True)
+def test_set_op(op_case):
+    input, other = op_case.input, op_case.other
     name_attr = 'name' if isinstance(input, IndexSet1D) else 'names'
 
-    assert getattr(input.union(other), name_attr) == getattr(exp_union, name_attr)
-    assert getattr(input.intersection(other), name_attr) == getattr(exp_intscn, name_attr)
-    assert getattr(input.difference(other), name_attr) == getattr(exp_diff, name_attr)
-    assert getattr(input.symmetric_difference(other), name_attr) == getattr(exp_symdiff, name_attr)
-
-
-@pytest.mark.parametrize('cls', [list, set, dict.fromkeys])
-@pytest.mark.parametrize(
-    '_input, _other, _exp_union, _exp_intscn, _exp_diff, _exp_symdiff', set_op_test_cases
-)
-def test_set_operators_typerr(
-    request, cls, _input, _other, _exp_union, _exp_intscn, _exp_diff, _exp_symdiff
-):
-    input, other = request.getfixturevalue(_input), cls(request.getfixturevalue(_other))
-
-    with pytest.raises(TypeError):
-        _ = input | other
-    with pytest.raises(TypeError):
-        _ = input & other
-    with pytest.raises(TypeError):
-        _ = input - other
-    with pytest.raises(TypeError):
-        _ = input ^ other
-
-
-@pytest.mark.parametrize(
-    '_input, _other, _exp_union, _exp_intscn, _exp_diff, _exp_symdiff', set_op_test_cases
-)
-def test_set_union_inplace_pass(
-    request, _input, _other, _exp_union, _exp_intscn, _exp_diff, _exp_symdiff
-):
-    input, other = request.getfixturevalue(_input), request.getfixturevalue(_other)
-    exp_union = request.getfixturevalue(_exp_union) if isinstance(_exp_union, str) else _exp_union
-
-    input |= other
-    assert input == exp_union
-
-
-@pytest.mark.parametrize(
-    '_input, _other, _exp_union, _exp_intscn, _exp_diff, _exp_symdiff', set_op_test_cases
-)
-def test_set_intersection_inplace_pass(
-    request, _input, _other, _exp_union, _exp_intscn, _exp_diff, _exp_symdiff
-):
-    input, other = request.getfixturevalue(_input), request.getfixturevalue(_other)
-    exp_intscn = (
-        request.getfixturevalue(_exp_intscn) if isinstance(_exp_intscn, str) else _exp_intscn
-    )
-
-    input &= other
-    assert input == exp_intscn
-
-
-@pytest.mark.parametrize(
-    '_input, _other, _exp_union, _exp_intscn, _exp_diff, _exp_symdiff', set_op_test_cases
-)
-def test_set_difference_inplace_pass(
-    request, _input, _other, _exp_union, _exp_intscn, _exp_diff, _exp_symdiff
-):
-    input, other = request.getfixturevalue(_input), request.getfixturevalue(_other)
-    exp_diff = request.getfixturevalue(_exp_diff) if isinstance(_exp_diff, str) else _exp_diff
-
-    input -= other
-    assert input == exp_diff
-
-
-@pytest.mark.parametrize(
-    '_input, _other, _exp_union, _exp_intscn, _exp_diff, _exp_symdiff', set_op_test_cases
-)
-def test_set_symdifference_inplace_pass(
-    request, _input, _other, _exp_union, _exp_intscn, _exp_diff, _exp_symdiff
-):
-    input, other = request.getfixturevalue(_input), request.getfixturevalue(_other)
-    exp_symdiff = (
-        request.getfixturevalue(_exp_symdiff) if isinstance(_exp_symdiff, str) else _exp_symdiff
-    )
-
-    input ^= other
-    assert input == exp_symdiff
-
-
-@pytest.mark.parametrize('cls', [list, set, dict.fromkeys])
-@pytest.mark.parametrize(
-    '_input, _other, _exp_union, _exp_intscn, _exp_diff, _exp_symdiff', set_op_test_cases
-)
-def test_set_set_operator_inplace_typerr(
-    request, cls, _input, _other, _exp_union, _exp_intscn, _exp_diff, _exp_symdiff
-):
-    input, other = request.getfixturevalue(_input), cls(request.getfixturevalue(_other))
-
-    with pytest.raises(TypeError), assert_not_mutated(input):
-        input |= other
-    with pytest.raises(TypeError), assert_not_mutated(input):
-        input &= other
-    with pytest.raises(TypeError), assert_not_mutated(input):
-        input -= other
-    with pytest.raises(TypeError), assert_not_mutated(input):
-        input ^= other
+    for op_id, op in SET_OPS.items():
+        expected = getattr(op_case, 'exp_' + op_id.split('_')[1])
+        # Set methods also accept plain iterables while operators only accept index-sets
+        clss = [list, set, dict.fromkeys] if op_id.startswith('method') else []
+
+        for _other in [other, *(cls(other) for cls in clss)]:
+            if not op_id.startswith('inplace'):
+                result = op(input, _other)
+            else:
+                # Inplace operators act on a copy so that every op sees the original input, and rows
+                # whose other is the input itself keep testing self-aliased ops such as `s -= s`
+                target = copy(input)
+                result = op(target, target if _other is input else _other)
+            assert result == expected, op_id
+            assert getattr(result, name_attr) == getattr(expected, name_attr), op_id
+
+
+@pytest.mark.parametrize('op_case', set_op_test_cases, indirect=True)
+def test_set_op_typerr(op_case):
+    input = op_case.input
+    bad_op_ids = [op_id for op_id in SET_OPS if not op_id.startswith('method')]
+
+    for op_id in bad_op_ids:
+        for cls in [list, set, dict.fromkeys]:
+            with pytest.raises(TypeError), assert_not_mutated(input):
+                SET_OPS[op_id](input, cls(op_case.other))
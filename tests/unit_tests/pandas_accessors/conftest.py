@@ -0,0 +1,137 @@
+# Copyright 2025 Samarth Mistry
+# This file is part of the `opti-extensions` package, which is released under
+# the Apache Licence, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0).
+
+"""Common fixtures for testing pandas accessors."""
+
+import pandas as pd
+import pytest
+
+# The accessors never mutate the pandas objects, so they are built once per session
+
+
+@pytest.fixture(scope='session')
+def ser_range3():
+    return pd.Series(range(3))
+
+
+@pytest.fixture(scope='session')
+def ser_range3_named():
+    return pd.Series(range(3), name='VAL')
+
+
+@pytest.fixture(scope='session')
+def ser_range3_idx_str():
+    return pd.Series(range(3), index=('A', 'B', 'C'))
+
+
+@pytest.fixture(scope='session')
+def ser_range3_idx_tuple():
+    return pd.Series(range(3), index=(('A', 'X'), ('B', 'Y'), ('C', 'Z')))
+
+
+@pytest.fixture(scope='session')
+def ser_float_idx_str():
+    return pd.Series([0.0, 1.0], index=('A', 'B'))
+
+
+@pytest.fixture(scope='session')
+def df_A():
+    return pd.DataFrame({'A': (0, 1, 2)})
+
+
+@pytest.fixture(scope='session')
+def df_AB():
+    return pd.DataFrame({'A': (0, 1, 2), 'B': ('X', 'Y', 'Z')})
+
+
+@pytest.fixture(scope='session')
+def df_range3_col():
+    return pd.Series(range(3)).to_frame(name='col')
+
+
+@pytest.fixture(scope='session')
+def df_idx_col_int():
+    return pd.DataFrame({'idx': ('A', 'B', 'C'), 'col': (0, 1, 2)}).set_index('idx')
+
+
+@pytest.fixture(scope='session')
+def df_idx_col_float():
+    return pd.DataFrame({'idx': ('A', 'B', 'C'), 'col': (0.0, 1.0, 2.0)}).set_index('idx')
+
+
+@pytest.fixture(scope='session')
+def ser_idx_col_int(df_idx_col_int):
+    return df_idx_col_int['col']
+
+
+@pytest.fixture(scope='session')
+def df_idx2_col_float():
+    return pd.DataFrame({'idx1': ('A', 'B'), 'idx2': ('X', 'Y'), 'col': (0.0, 1.0)}).set_index(
+        ['idx1', 'idx2']
+    )
+
+
+@pytest.fixture(scope='session')
+def idx_range3(ser_range3):
+    return ser_range3.index
+
+
+@pytest.fixture(scope='session')
+def idx_named(ser_range3_named):
+    return ser_range3_named.rename_axis(['IDX'], axis=0).index
+
+
+@pytest.fixture(scope='session')
+def idx_ABC(ser_range3_idx_str):
+    return ser_range3_idx_str.index
+
+
+@pytest.fixture(scope='session')
+def idx_tuples(ser_range3_idx_tuple):
+    return ser_range3_idx_tuple.index
+
+
+@pytest.fixture(scope='session')
+def idx_df_A(df_A):
+    return df_A.index
+
+
+@pytest.fixture(scope='session')
+def idx_df_A_named(df_A):
+    return df_A.rename_axis(['ROW'], axis=0).index
+
+
+@pytest.fixture(scope='session')
+def cols_A(df_A):
+    return df_A.columns
+
+
+@pytest.fixture(scope='session')
+def cols_A_named(df_A):
+    return df_A.rename_axis(['COL'], axis=1).columns
+
+
+@pytest.fixture(scope='session')
+def cols_AB(df_AB):
+    return df_AB.columns
+
+
+@pytest.fixture(scope='session')
+def cols_tuples():
+    return pd.DataFrame([range(3)], columns=(('A', 'X'), ('B', 'Y'), ('C', 'Z'))).columns
+
+
+@pytest.fixture(scope='session')
+def cols_tuples_named():
+    return (
+        pd.DataFrame([range(2)], columns=(('A', 'X'), ('B', 'Y')))
+        .rename_axis(['L1', 'L2'], axis=1)
+        .columns
+    )
+
+
+@pytest.fixture
+def pd_input(request):
+    """Resolve the pandas fixture named by an indirect parametrize value."""
+    return request.getfixturevalue(request.param)
@@ -13,115 +13,124 @@ from ..helper_indexset import assert_sets_same
 
 
 @pytest.mark.parametrize(
-    'input, expected',
+    'pd_input, expected',
     [
-        (pd.Series(range(3)), IndexSet1D(range(3))),
-        (pd.Series(range(3), index=('A', 'B', 'C')), IndexSet1D(range(3))),
-        (pd.Series(range(3), index=(('A', 'X'), ('B', 'Y'), ('C', 'Z'))), IndexSet1D(range(3))),
-        (pd.DataFrame({'A': (0, 1, 2)}), IndexSet1D(range(3))),
-        (
-            pd.DataFrame({'A': (0, 1, 2), 'B': ('X', 'Y', 'Z')}),
-            IndexSetND([(0, 'X'), (1, 'Y'), (2, 'Z')]),
-        ),
-        (pd.Series(range(3)).index, IndexSet1D(range(3))),
-        (pd.Series(range(3), index=('A', 'B', 'C')).index, IndexSet1D(['A', 'B', 'C'])),
-        (
-            pd.Series(range(3), index=(('A', 'X'), ('B', 'Y'), ('C', 'Z'))).index,
-            IndexSetND([('A', 'X'), ('B', 'Y'), ('C', 'Z')]),
-        ),
-        (pd.DataFrame({'A': (0, 1, 2)}).index, IndexSet1D(range(3))),
-        (pd.DataFrame({'A': (0, 1, 2)}).columns, IndexSet1D(['A'])),
-        (
-            pd.DataFrame({'A': (0, 1, 2), 'B': ('X', 'Y', 'Z')}).columns,
-            IndexSet1D(['A', 'B']),
-        ),
-        (
-            pd.DataFrame([range(3)], columns=(('A', 'X'), ('B', 'Y'), ('C', 'Z'))).columns,
-            IndexSetND([('A', 'X'), ('B', 'Y'), ('C', 'Z')]),
-        ),
+        ('ser_range3', IndexSet1D(range(3))),
+        ('ser_range3_idx_str', IndexSet1D(range(3))),
+        ('ser_range3_idx_tuple', IndexSet1D(range(3))),
+        ('df_A', IndexSet1D(range(3))),
+        ('df_AB', IndexSetND([(0, 'X'), (1, 'Y'), (2, 'Z')])),
+        ('idx_range3', IndexSet1D(range(3))),
+        ('idx_ABC', IndexSet1D(['A', 'B', 'C'])),
+        ('idx_tuples', IndexSetND([('A', 'X'), ('B', 'Y'), ('C', 'Z')])),
+        ('idx_df_A', IndexSet1D(range(3))),
+        ('cols_A', IndexSet1D(['A'])),
+        ('cols_AB', IndexSet1D(['A', 'B'])),
+        ('cols_tuples', IndexSetND([('A', 'X'), ('B', 'Y'), ('C', 'Z')])),
     ],
+    indirect=['pd_input'],
 )
-def test_to_indexset_pass(input, expected):
-    assert_sets_same(input.opti.to_indexset(), expected)
+def test_to_indexset_pass(pd_input, expected):
+    assert_sets_same(pd_input.opti.to_indexset(), expected)
 
 
 @pytest.mark.parametrize(
-    'input, name, attrname',
+    'pd_input, name, attrname',
     [
-        (pd.Series(range(3)), None, 'name'),
-        (pd.Series(range(3), name='ABC'), 'ABC', 'name'),
-        (pd.DataFrame({'ABC': (0, 1, 2)}), 'ABC', 'name'),
-        (pd.DataFrame({'A': (0, 1, 2), 'B': ('X', 'Y', 'Z')}), ['A', 'B'], 'names'),
-        (pd.Series(range(3), name='VAL').rename_axis(['IDX'], axis=0).index, 'IDX', 'name'),
-        (pd.DataFrame({'A': (0, 1, 2)}).index, None, 'name'),
-        (pd.DataFrame({'A': (0, 1, 2)}).rename_axis(['ROW'], axis=0).index, 'ROW', 'name'),
-        (pd.DataFrame({'A': (0, 1, 2)}).columns, None, 'name'),
-        (pd.DataFrame({'A': (0, 1, 2)}).rename_axis(['COL'], axis=1).columns, 'COL', 'name'),
-        (
-            (
-                pd.DataFrame([range(2)], columns=(('A', 'X'), ('B', 'Y')))
-                .rename_axis(['L1', 'L2'], axis=1)
-                .columns
-            ),
-            ['L1', 'L2'],
-            'names',
-        ),
+        ('ser_range3', None, 'name'),
+        ('ser_range3_named', 'VAL', 'name'),
+        ('df_A', 'A', 'name'),
+        ('df_AB', ['A', 'B'], 'names'),
+        ('idx_named', 'IDX', 'name'),
+        ('idx_df_A', None, 'name'),
+        ('idx_df_A_named', 'ROW', 'name'),
+        ('cols_A', None, 'name'),
+        ('cols_A_named', 'COL', 'name'),
+        ('cols_tuples_named', ['L1', 'L2'], 'names'),
     ],
+    indirect=['pd_input'],
 )
-def test_to_indexset_name(input, name, attrname):
-    iset = input.opti.to_indexset()
+def test_to_indexset_name(pd_input, name, attrname):
+    iset = pd_input.opti.to_indexset()
     assert getattr(iset, attrname) == name
 
 
 @pytest.mark.parametrize(
-    'input',
+    'make_input',
     [
-        pd.Series(name='EMP'),
-        pd.DataFrame(columns=['EMP']),
-        pd.DataFrame(columns=['EMP1', 'EMP2']),
-        pd.Series(name='EMP').index,
-        pd.DataFrame(columns=['EMP']).index,
-        pd.DataFrame().columns,
+        pytest.param(lambda: pd.Series(name='EMP'), id='ser_emp'),
+        pytest.param(lambda: pd.DataFrame(columns=['EMP']), id='df_emp'),
+        pytest.param(lambda: pd.DataFrame(columns=['EMP1', 'EMP2']), id='df_emp_2cols'),
+        pytest.param(lambda: pd.Series(name='EMP').index, id='ser_emp_index'),
+        pytest.param(lambda: pd.DataFrame(columns=['EMP']).index, id='df_emp_index'),
+        pytest.param(lambda: pd.DataFrame().columns, id='df_emp_columns'),
     ],
 )
-def test_to_indexset_emp_valerr(input):
+def test_to_indexset_emp_valerr(make_input):
+    input = make_input()
     with pytest.raises(ValueError):
         input.opti.to_indexset()
 
 
 @pytest.mark.parametrize(
-    'input',
+    'make_input',
     [
-        pd.Series([1, 1, 1], name='DUP'),
-        pd.DataFrame([1, 1, 1], columns=['DUP']),
-        pd.DataFrame({'A': (0, 1, 1), 'B': (0, 1, 1)}),
-        pd.DataFrame({'A': (0, 1, 1), 'B': (0, 'A', 'A')}),
-        pd.Series(range(3), name='A', index=[0, 0, 0]).index,
-        pd.DataFrame(range(3), columns=['A'], index=[0, 0, 0]).index,
-        pd.DataFrame(columns=['A', 'A', 'B']).columns,
-        pd.DataFrame(range(2), columns=['A'], index=((0, 0), (0, 0))).index,
-        pd.DataFrame([range(2)], columns=(('A', 'B'), ('A', 'B'))).columns,
+        pytest.param(lambda: pd.Series([1, 1, 1], name='DUP'), id='ser_dup'),
+        pytest.param(lambda: pd.DataFrame([1, 1, 1], columns=['DUP']), id='df_dup'),
+        pytest.param(lambda: pd.DataFrame({'A': (0, 1, 1), 'B': (0, 1, 1)}), id='df_2cols_dup_int'),
+        pytest.param(
+            lambda: pd.DataFrame({'A': (0, 1, 1), 'B': (0, 'A', 'A')}),
+            id='df_2cols_dup_mix',
+        ),
+        pytest.param(
+            lambda: pd.Series(range(3), name='A', index=[0, 0, 0]).index,
+            id='ser_dup_index',
+        ),
+        pytest.param(
+            lambda: pd.DataFrame(range(3), columns=['A'], index=[0, 0, 0]).index,
+            id='df_dup_index',
+        ),
+        pytest.param(lambda: pd.DataFrame(columns=['A', 'A', 'B']).columns, id='df_dup_columns'),
+        pytest.param(
+            lambda: pd.DataFrame(range(2), columns=['A'], index=((0, 0), (0, 0))).index,
+            id='df_dup_index_tuple',
+        ),
+        pytest.param(
+            lambda: pd.DataFrame([range(2)], columns=(('A', 'B'), ('A', 'B'))).columns,
+            id='df_dup_columns_tuple',
+        ),
     ],
 )
-def test_to_indexset_duplicate_valerr(input):
+def test_to_indexset_duplicate_valerr(make_input):
+    input = make_input()
     with pytest.raises(ValueError):
         input.opti.to_indexset()
 
 
 @pytest.mark.parametrize(
-    'input',
+    'make_input',
     [
-        pd.Series([(0, 0), 1, 2], name='X'),
-        pd.Series([[0, 0], 1, 2], name='X'),
-        pd.Series([{0}, 1, 2], name='X'),
-        pd.DataFrame({'A': ((0, 0), 1), 'B': (0, 'A')}),
-        pd.DataFrame({'A': ([0, 0], 'B'), 'B': (0, 'A')}),
-        pd.DataFrame({'A': ({0}, 'B'), 'B': (0, 'A')}),
-        pd.Series(range(2), index=[(0, 0), (0, 1)]).index,
-        pd.DataFrame(range(2), index=[(0, 0), (0, 1)]).index,
-        pd.DataFrame([range(2)], columns=[(0, 0), (0, 1)]).columns,
+        pytest.param(lambda: pd.Series([(0, 0), 1, 2], name='X'), id='ser_tuple'),
+        pytest.param(lambda: pd.Series([[0, 0], 1, 2], name='X'), id='ser_list'),
+        pytest.param(lambda: pd.Series([{0}, 1, 2], name='X'), id='ser_set'),
+        pytest.param(lambda: pd.DataFrame({'A': ((0, 0), 1), 'B': (0, 'A')}), id='df_tuple'),
+        pytest.param(lambda: pd.DataFrame({'A': ([0, 0], 'B'), 'B': (0, 'A')}), id='df_list'),
+        pytest.param(lambda: pd.DataFrame({'A': ({0}, 'B'), 'B': (0, 'A')}), id='df_set'),
+        pytest.param(
+            lambda: pd.Series(range(2), index=[(0, 0), (0, 1)]).index,
+            id='ser_index_tuple',
+        ),
+        pytest.param(
+            lambda: pd.DataFrame(range(2), index=[(0, 0), (0, 1)]).index,
+            id='df_index_tuple',
+        ),
+        pytest.param(
+            lambda: pd.DataFrame([range(2)], columns=[(0, 0), (0, 1)]).columns,
+            id='df_columns_tuple',
+        ),
     ],
 )
-def test_to_indexset_nonscal_typerr(input):
+def test_to_indexset_nonscal_typerr(make_input):
+    input = make_input()
     with pytest.raises(TypeError):
         input.opti.to_indexset()
@@ -11,125 +11,136 @@ from opti_extensions import ParamDict1D, ParamDictND
 
 
 @pytest.mark.parametrize(
-    'input, expected',
+    'pd_input, expected',
     [
-        (pd.Series(range(3)), ParamDict1D({0: 0, 1: 1, 2: 2})),
-        (pd.Series(range(3), index=('A', 'B', 'C')), ParamDict1D({'A': 0, 'B': 1, 'C': 2})),
-        (pd.Series([0.0, 1.0], index=('A', 'B')), ParamDict1D({'A': 0.0, 'B': 1.0})),
-        (
-            pd.DataFrame({'idx': ('A', 'B', 'C'), 'col': (0, 1, 2)}).set_index('idx'),
-            ParamDict1D({'A': 0, 'B': 1, 'C': 2}),
-        ),
-        (
-            pd.DataFrame({'idx': ('A', 'B', 'C'), 'col': (0.0, 1.0, 2.0)}).set_index('idx'),
-            ParamDict1D({'A': 0.0, 'B': 1.0, 'C': 2.0}),
-        ),
-        (
-            pd.Series(range(3), index=(('A', 'X'), ('B', 'Y'), ('C', 'Z'))),
-            ParamDictND({('A', 'X'): 0, ('B', 'Y'): 1, ('C', 'Z'): 2}),
-        ),
-        (
-            pd.DataFrame({'idx1': ('A', 'B'), 'idx2': ('X', 'Y'), 'col': (0.0, 1.0)}).set_index(
-                ['idx1', 'idx2']
-            ),
-            ParamDictND({('A', 'X'): 0.0, ('B', 'Y'): 1.0}),
-        ),
+        ('ser_range3', ParamDict1D({0: 0, 1: 1, 2: 2})),
+        ('ser_range3_idx_str', ParamDict1D({'A': 0, 'B': 1, 'C': 2})),
+        ('ser_float_idx_str', ParamDict1D({'A': 0.0, 'B': 1.0})),
+        ('df_idx_col_int', ParamDict1D({'A': 0, 'B': 1, 'C': 2})),
+        ('df_idx_col_float', ParamDict1D({'A': 0.0, 'B': 1.0, 'C': 2.0})),
+        ('ser_range3_idx_tuple', ParamDictND({('A', 'X'): 0, ('B', 'Y'): 1, ('C', 'Z'): 2})),
+        ('df_idx2_col_float', ParamDictND({('A', 'X'): 0.0, ('B', 'Y'): 1.0})),
     ],
+    indirect=['pd_input'],
 )
-def test_to_paramdict_pass(input, expected):
-    assert input.opti.to_paramdict() == expected
+def test_to_paramdict_pass(pd_input, expected):
+    assert pd_input.opti.to_paramdict() == expected
 
 
 @pytest.mark.parametrize(
-    'input, valuename',
+    'pd_input, valuename',
     [
-        (pd.Series(range(3)), None),
-        (pd.Series(range(3), name='VAL'), 'VAL'),
-        (pd.DataFrame({'idx': ('A', 'B', 'C'), 'col': (0, 1, 2)}).set_index('idx'), 'col'),
-        (
-            pd.DataFrame({'idx1': ('A', 'B'), 'idx2': ('X', 'Y'), 'col': (0.0, 1.0)}).set_index(
-                ['idx1', 'idx2']
-            ),
-            'col',
-        ),
+        ('ser_range3', None),
+        ('ser_range3_named', 'VAL'),
+        ('df_idx_col_int', 'col'),
+        ('df_idx2_col_float', 'col'),
     ],
+    indirect=['pd_input'],
 )
-def test_to_paramdict_valuename(input, valuename):
-    param = input.opti.to_paramdict()
+def test_to_paramdict_valuename(pd_input, valuename):
+    param = pd_input.opti.to_paramdict()
     assert param.value_name == valuename
 
 
 @pytest.mark.parametrize(
-    'input, keyname, attrname',
+    'pd_input, keyname, attrname',
     [
-        (pd.Series(range(3)), None, 'key_name'),
-        (pd.Series(range(3)).to_frame(name='col'), None, 'key_name'),
-        (
-            pd.DataFrame({'idx': ('A', 'B', 'C'), 'col': (0, 1, 2)}).set_index('idx')['col'],
-            'idx',
-            'key_name',
-        ),
-        (
-            pd.DataFrame({'idx': ('A', 'B', 'C'), 'col': (0, 1, 2)}).set_index('idx'),
-            'idx',
-            'key_name',
-        ),
-        (pd.Series(range(3), index=(('A', 'X'), ('B', 'Y'), ('C', 'Z'))), None, 'key_names'),
-        (
-            pd.DataFrame({'idx1': ('A', 'B'), 'idx2': ('X', 'Y'), 'col': (0.0, 1.0)}).set_index(
-                ['idx1', 'idx2']
-            ),
-            ['idx1', 'idx2'],
-            'key_names',
-        ),
+        ('ser_range3', None, 'key_name'),
+        ('df_range3_col', None, 'key_name'),
+        ('ser_idx_col_int', 'idx', 'key_name'),
+        ('df_idx_col_int', 'idx', 'key_name'),
+        ('ser_range3_idx_tuple', None, 'key_names'),
+        ('df_idx2_col_float', ['idx1', 'idx2'], 'key_names'),
     ],
+    indirect=['pd_input'],
 )
-def test_to_paramdict_keyname(input, keyname, attrname):
-    param = input.opti.to_paramdict()
+def test_to_paramdict_keyname(pd_input, keyname, attrname):
+    param = pd_input.opti.to_paramdict()
     assert getattr(param, attrname) == keyname
 
 
-@pytest.mark.parametrize('input', [pd.Series(name='EMP'), pd.DataFrame(columns=['EMP'])])
-def test_to_paramdict_emp_valerr(input):
+@pytest.mark.parametrize(
+    'make_input',
+    [
+        pytest.param(lambda: pd.Series(name='EMP'), id='ser_emp'),
+        pytest.param(lambda: pd.DataFrame(columns=['EMP']), id='df_emp'),
+    ],
+)
+def test_to_paramdict_emp_valerr(make_input):
+    input = make_input()
     with pytest.raises(ValueError):
         input.opti.to_paramdict()
 
 
 @pytest.mark.parametrize(
-    'input',
+    'make_input',
     [
-        pd.DataFrame({'col1': (1, 2), 'col2': (1.0, 2.0)}),
-        pd.DataFrame({'idx': ('A', 'B'), 'col1': (1, 2), 'col2': (1.0, 2.0)}).set_index('idx'),
+        pytest.param(lambda: pd.DataFrame({'col1': (1, 2), 'col2': (1.0, 2.0)}), id='df_2cols'),
+        pytest.param(
+            lambda: pd.DataFrame({'idx': ('A', 'B'), 'col1': (1, 2), 'col2': (1.0, 2.0)}).set_index(
+                'idx'
+            ),
+            id='df_idx_2cols',
+        ),
     ],
 )
-def test_to_paramdict_multiple_cols_valerr(input):
+def test_to_paramdict_multiple_cols_valerr(make_input):
+    input = make_input()
     with pytest.raises(ValueError):
         input.opti.to_paramdict()
 
 
 @pytest.mark.parametrize(
-    'input',
+    'make_input',
     [
-        pd.DataFrame({'idx': ('A', 'B', 'B'), 'col': (1, 2, 3)}).set_index('idx'),
-        pd.DataFrame({'idx': ('A', 'B', 'B'), 'col': (1, 2, 3)}).set_index('idx')['col'],
+        pytest.param(
+            lambda: pd.DataFrame({'idx': ('A', 'B', 'B'), 'col': (1, 2, 3)}).set_index('idx'),
+            id='df_dup_idx',
+        ),
+        pytest.param(
+            lambda: pd.DataFrame({'idx': ('A', 'B', 'B'), 'col': (1, 2, 3)}).set_index('idx')[
+                'col'
+            ],
+            id='ser_dup_idx',
+        ),
     ],
 )
-def test_to_paramdict_duplicate_idx_valerr(input):
+def test_to_paramdict_duplicate_idx_valerr(make_input):
+    input = make_input()
     with pytest.raises(ValueError):
         input.opti.to_paramdict()
 
 
 @pytest.mark.parametrize(
-    'input',
+    'make_input',
     [
-        pd.DataFrame({'idx': (['A', 'B'], 'C'), 'col': (1, 2)}).set_index('idx'),
-        pd.DataFrame({'idx': (['A', 'B'], 'C'), 'col': (1, 2)}).set_index('idx')['col'],
-        pd.DataFrame({'idx': (('A', 'B'), 'C'), 'col': (1, 2)}).set_index('idx'),
-        pd.DataFrame({'idx': (('A', 'B'), 'C'), 'col': (1, 2)}).set_index('idx')['col'],
-        pd.DataFrame({'idx': ({'A', 'B'}, 'C'), 'col': (1, 2)}).set_index('idx'),
-        pd.DataFrame({'idx': ({'A', 'B'}, 'C'), 'col': (1, 2)}).set_index('idx')['col'],
+        pytest.param(
+            lambda: pd.DataFrame({'idx': (['A', 'B'], 'C'), 'col': (1, 2)}).set_index('idx'),
+            id='df_list_idx',
+        ),
+        pytest.param(
+            lambda: pd.DataFrame({'idx': (['A', 'B'], 'C'), 'col': (1, 2)}).set_index('idx')['col'],
+            id='ser_list_idx',
+        ),
+        pytest.param(
+            lambda: pd.DataFrame({'idx': (('A', 'B'), 'C'), 'col': (1, 2)}).set_index('idx'),
+            id='df_tuple_idx',
+        ),
+        pytest.param(
+            lambda: pd.DataFrame({'idx': (('A', 'B'), 'C'), 'col': (1, 2)}).set_index('idx')['col'],
+            id='ser_tuple_idx',
+        ),
+        pytest.param(
+            lambda: pd.DataFrame({'idx': ({'A', 'B'}, 'C'), 'col': (1, 2)}).set_index('idx'),
+            id='df_set_idx',
+        ),
+        pytest.param(
+            lambda: pd.DataFrame({'idx': ({'A', 'B'}, 'C'), 'col': (1, 2)}).set_index('idx')['col'],
+            id='ser_set_idx',
+        ),
     ],
 )
-def test_to_paramdict_nonscal_typerr(input):
+def test_to_paramdict_nonscal_typerr(make_input):
+    input = make_input()
     with pytest.raises(TypeError):
         input.opti.to_paramdict()
@@ -4,46 +4,98 @@
 
 """Common fixtures and functionality for testing parameter functionality."""
 
+from itertools import product
+
 import pytest
 
-from opti_extensions import IndexSetND, ParamDict1D, ParamDictND
+from opti_extensions import ParamDict1D, ParamDictND
 
+# Param-dicts are built once per session for the tests that only read them; tests that mutate their
+# input must request the function-scoped `*_mut` variant defined at the bottom of this module
 
-@pytest.fixture
+
+@pytest.fixture(scope='session')
 def paramdict1d_emp():
     return ParamDict1D()
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def paramdict1d_pop2():
     return ParamDict1D({'A': 0, 'B': 1})
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def paramdict1d_pop3():
     return ParamDict1D({'A': 0, 'B': 1, 'C': 2})
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def paramdictNd_emp():
     return ParamDictND()
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def paramdictNd_pop2():
     return ParamDictND({('A', 'B'): 0, ('C', 'D'): 1})
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def paramdictNd_pop3():
     return ParamDictND({('A', 'B'): 0, ('C', 'D'): 1, ('E', 'F'): 2})
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def paramdictNd_cmb2():
-    return ParamDictND({j: i for i, j in enumerate(IndexSetND(range(2), range(2)))})
+    return ParamDictND({j: i for i, j in enumerate(product(range(2), repeat=2))})
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def paramdictNd_cmb3():
-    return ParamDictND({j: i for i, j in enumerate(IndexSetND(range(2), range(2), range(2)))})
+    return ParamDictND({j: i for i, j in enumerate(product(range(2), repeat=3))})
+
+
+@pytest.fixture
+def paramdict1d_emp_mut():
+    return ParamDict1D()
+
+
+@pytest.fixture
+def paramdict1d_pop2_mut():
+    return ParamDict1D({'A': 0, 'B': 1})
+
+
+@pytest.fixture
+def paramdict1d_pop3_mut():
+    return ParamDict1D({'A': 0, 'B': 1, 'C': 2})
+
+
+@pytest.fixture
+def paramdictNd_emp_mut():
+    return ParamDictND()
+
+
+@pytest.fixture
+def paramdictNd_pop2_mut():
+    return ParamDictND({('A', 'B'): 0, ('C', 'D'): 1})
+
+
+@pytest.fixture
+def paramdictNd_pop3_mut():
+    return ParamDictND({('A', 'B'): 0, ('C', 'D'): 1, ('E', 'F'): 2})
+
+
+@pytest.fixture
+def paramdictNd_cmb2_mut():
+    return ParamDictND({j: i for i, j in enumerate(product(range(2), repeat=2))})
+
+
+@pytest.fixture
+def input_dict(request):
+    """Resolve the param-dict fixture named by an indirect parametrize value."""
+    return request.getfixturevalue(request.param)
+
+
+@pytest.fixture
+def expected_dict(request):
+    """Resolve the expected param-dict fixture named by an indirect parametrize value."""
+    return request.getfixturevalue(request.param)
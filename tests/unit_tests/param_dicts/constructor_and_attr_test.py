@@ -10,16 +10,22 @@ import pytest
 
 from opti_extensions import ParamDict1D, ParamDictND
 
+PARAMDICT1D_DATA = {'A': 0, 'B': 1, 'C': 2}
+PARAMDICTND_DATA = {('A', 'B'): 0, ('C', 'D'): 1, ('E', 'F'): 2}
+CLS_DATA = [(ParamDict1D, PARAMDICT1D_DATA), (ParamDictND, PARAMDICTND_DATA)]
+INVALID_NAMES = [123, 1.9, ('A', 'B', 'C'), ['A', 'B'], {'ABC'}]
+INVALID_KEYNAMES = [123, 0.0, int, 'ABC', [1], [1, 2, 3], [1, 'A', 'B'], (1, 'D', 9.0), {'A', 'B'}]
+
 
 @pytest.mark.parametrize(
     'cls, input',
     [
-        (ParamDict1D, {}),
-        (ParamDict1D, {'A': 0, 'B': 1, 'C': 2}),
-        (ParamDict1D, {1: 0, 2: 1.0, 3: 2.1}),
-        (ParamDictND, {}),
-        (ParamDictND, {('A', 'B'): 0, ('C', 'D'): 1, ('E', 'F'): 2}),
-        (ParamDictND, {(0, 'B'): 0, (1, 'D'): 1.0, (2, 'F'): 1.5}),
+        pytest.param(ParamDict1D, {}, id='1D_emp'),
+        pytest.param(ParamDict1D, PARAMDICT1D_DATA, id='1D_str_int'),
+        pytest.param(ParamDict1D, {1: 0, 2: 1.0, 3: 2.1}, id='1D_int_mixed'),
+        pytest.param(ParamDictND, {}, id='ND_emp'),
+        pytest.param(ParamDictND, PARAMDICTND_DATA, id='ND_str_int'),
+        pytest.param(ParamDictND, {(0, 'B'): 0, (1, 'D'): 1.0, (2, 'F'): 1.5}, id='ND_mixed'),
     ],
 )
 def test_paramdict_init_pass(cls, input):
@@ -31,13 +37,10 @@ def test_paramdict_init_pass(cls, input):
 
 
 @pytest.mark.parametrize('cls', [ParamDict1D, ParamDictND])
-@pytest.mark.parametrize(
-    'input',
-    [1, float, 'A', (1, 2, 3), ['A', 1, 2]],
-)
-def test_paramdict_init_nondict(cls, input):
-    with pytest.raises(TypeError):
-        cls(input)
+def test_paramdict_init_nondict(cls):
+    for input in [1, float, 'A', (1, 2, 3), ['A', 1, 2]]:
+        with pytest.raises(TypeError):
+            cls(input)
 
 
 @pytest.mark.parametrize('cls', [ParamDict1D, ParamDictND])
@@ -61,14 +64,14 @@ def test_paramdictNd_init_elem_difflen(input):
 @pytest.mark.parametrize(
     'cls, input',
     [
-        (ParamDict1D, {'A': 1, 'B': 'X'}),
-        (ParamDict1D, {'A': 1, 'B': (1, 2, 3)}),
-        (ParamDict1D, {'A': 1, 'B': {1, 2, 3}}),
-        (ParamDict1D, {'A': 1, 'B': [1, 2, 3]}),
-        (ParamDictND, {(0, 'A'): 1, (1, 'B'): 'X'}),
-        (ParamDictND, {(0, 'A'): 1, (1, 'B'): (1, 2, 3)}),
-        (ParamDictND, {(0, 'A'): 1, (1, 'B'): {1, 2, 3}}),
-        (ParamDictND, {(0, 'A'): 1, (1, 'B'): [1, 2, 3]}),
+        pytest.param(ParamDict1D, {'A': 1, 'B': 'X'}, id='1D_str'),
+        pytest.param(ParamDict1D, {'A': 1, 'B': (1, 2, 3)}, id='1D_tuple'),
+        pytest.param(ParamDict1D, {'A': 1, 'B': {1, 2, 3}}, id='1D_set'),
+        pytest.param(ParamDict1D, {'A': 1, 'B': [1, 2, 3]}, id='1D_list'),
+        pytest.param(ParamDictND, {(0, 'A'): 1, (1, 'B'): 'X'}, id='ND_str'),
+        pytest.param(ParamDictND, {(0, 'A'): 1, (1, 'B'): (1, 2, 3)}, id='ND_tuple'),
+        pytest.param(ParamDictND, {(0, 'A'): 1, (1, 'B'): {1, 2, 3}}, id='ND_set'),
+        pytest.param(ParamDictND, {(0, 'A'): 1, (1, 'B'): [1, 2, 3]}, id='ND_list'),
     ],
 )
 def test_paramdict_init_other_value(cls, input):
@@ -82,10 +85,10 @@ def test_paramdict1d_init_keyname_pass(name):
     assert p.key_name == name
 
 
-@pytest.mark.parametrize('input', [123, 1.9, ('A', 'B', 'C'), ['A', 'B'], {'ABC'}])
-def test_paramdict1d_init_keyname_typeerr(input):
-    with pytest.raises(TypeError):
-        ParamDict1D({'A': 0, 'B': 1}, key_name=input)
+def test_paramdict1d_init_keyname_typeerr():
+    for input in INVALID_NAMES:
+        with pytest.raises(TypeError, match='`key_name` should be a string'):
+            ParamDict1D({'A': 0, 'B': 1}, key_name=input)
 
 
 @pytest.mark.parametrize('input', ['DEF', 'Z'])
@@ -95,11 +98,12 @@ def test_paramdict1d_init_keyname_update_pass(input):
     assert p.key_name == input
 
 
-@pytest.mark.parametrize('input', [123, 1.9, ('A', 'B', 'C'), ['A', 'B'], {'ABC'}])
-def test_paramdict1d_init_keyname_update_typeerr(input):
+def test_paramdict1d_init_keyname_update_typeerr():
     p = ParamDict1D({'A': 0, 'B': 1}, key_name='KEY')
-    with pytest.raises(TypeError):
-        p.key_name = input
+    for input in INVALID_NAMES:
+        with pytest.raises(TypeError, match='`key_name` should be a string'):
+            p.key_name = input
+    assert p.key_name == 'KEY'
 
 
 @pytest.mark.parametrize(
@@ -117,10 +121,10 @@ def test_paramdictNd_init_keynames_pass(input, expected):
     assert p.key_names == expected
 
 
-@pytest.mark.parametrize('input', [123, 'ABC', [1, 2, 3], [1, 'A', 'B'], {'A', 'B', 'C'}])
-def test_paramdictNd_init_keynames_typeerr(input):
-    with pytest.raises(TypeError):
-        ParamDictND({('A', 'B'): 0, ('C', 'D'): 1}, key_names=input)
+def test_paramdictNd_init_keynames_typeerr():
+    for input in INVALID_KEYNAMES:
+        with pytest.raises(TypeError, match='`key_names` should be a sequence of strings'):
+            ParamDictND({('A', 'B'): 0, ('C', 'D'): 1}, key_names=input)
 
 
 @pytest.mark.parametrize('input', [('C', 'D'), ['A', 'B', 'C']])
@@ -130,46 +134,29 @@ def test_paramdictNd_init_keynames_update_pass(input):
     assert p.key_names == list(input)
 
 
-@pytest.mark.parametrize('input', ['CD', 1, 0.0, int, [1], (1, 'D', 9.0), {'Z', 'Y'}])
-def test_paramdictNd_init_keynames_update_typeerr(input):
+def test_paramdictNd_init_keynames_update_typeerr():
     p = ParamDictND({('A', 'B'): 0, ('C', 'D'): 1}, key_names=('KEY1', 'KEY2'))
-    with pytest.raises(TypeError):
-        p.key_names = input
+    for input in INVALID_KEYNAMES:
+        with pytest.raises(TypeError, match='`key_names` should be a sequence of strings'):
+            p.key_names = input
+    assert p.key_names == ['KEY1', 'KEY2']
 
 
-@pytest.mark.parametrize(
-    'cls, data',
-    [
-        (ParamDict1D, {'A': 0, 'B': 1, 'C': 2}),
-        (ParamDictND, {('A', 'B'): 0, ('C', 'D'): 1, ('E', 'F'): 2}),
-    ],
-)
+@pytest.mark.parametrize('cls, data', CLS_DATA, ids=['1D', 'ND'])
 def test_paramdict_init_valname_pass(cls, data):
     name = 'VALUE'
     p = cls(data, value_name=name)
     assert p.value_name == name
 
 
-@pytest.mark.parametrize(
-    'cls, data',
-    [
-        (ParamDict1D, {'A': 0, 'B': 1, 'C': 2}),
-        (ParamDictND, {('A', 'B'): 0, ('C', 'D'): 1, ('E', 'F'): 2}),
-    ],
-)
-@pytest.mark.parametrize('input', [123, 1.9, ('A', 'B', 'C'), ['A', 'B'], {'ABC'}])
-def test_paramdict_init_valname_typeerr(cls, data, input):
-    with pytest.raises(TypeError):
-        cls(data, value_name=input)
+@pytest.mark.parametrize('cls, data', CLS_DATA, ids=['1D', 'ND'])
+def test_paramdict_init_valname_typeerr(cls, data):
+    for input in INVALID_NAMES:
+        with pytest.raises(TypeError, match='`value_name` should be a string'):
+            cls(data, value_name=input)
 
 
-@pytest.mark.parametrize(
-    'cls, data',
-    [
-        (ParamDict1D, {'A': 0, 'B': 1, 'C': 2}),
-        (ParamDictND, {('A', 'B'): 0, ('C', 'D'): 1, ('E', 'F'): 2}),
-    ],
-)
+@pytest.mark.parametrize('cls, data', CLS_DATA, ids=['1D', 'ND'])
 @pytest.mark.parametrize('input', ['DEF', 'Z'])
 def test_paramdict_init_valname_update_pass(cls, data, input):
     p = cls(data, value_name='VALUE')
@@ -177,25 +164,16 @@ def test_paramdict_init_valname_update_pass(cls, data, input):
     assert p.value_name == input
 
 
-@pytest.mark.parametrize(
-    'cls, data',
-    [
-        (ParamDict1D, {'A': 0, 'B': 1, 'C': 2}),
-        (ParamDictND, {('A', 'B'): 0, ('C', 'D'): 1, ('E', 'F'): 2}),
-    ],
-)
-@pytest.mark.parametrize('input', [123, 1.9, ('A', 'B', 'C'), ['A', 'B'], {'ABC'}])
-def test_paramdict_init_valname_update_typeerr(cls, data, input):
+@pytest.mark.parametrize('cls, data', CLS_DATA, ids=['1D', 'ND'])
+def test_paramdict_init_valname_update_typeerr(cls, data):
     p = cls(data, value_name='VALUE')
-    with pytest.raises(TypeError):
-        p.value_name = input
+    for input in INVALID_NAMES:
+        with pytest.raises(TypeError, match='`value_name` should be a string'):
+            p.value_name = input
+    assert p.value_name == 'VALUE'
 
 
-@pytest.mark.parametrize(
-    '_input', ['paramdict1d_emp', 'paramdictNd_emp', 'paramdict1d_pop3', 'paramdictNd_pop3']
-)
-def test_paramdict_isinstance_dict(request, _input):
-    input = request.getfixturevalue(_input)
-
-    assert isinstance(input, dict)
-    assert isinstance(input, abc.MutableMapping)
+@pytest.mark.parametrize('cls', [ParamDict1D, ParamDictND])
+def test_paramdict_isinstance_dict(cls):
+    assert issubclass(cls, dict)
+    assert issubclass(cls, abc.MutableMapping)
@@ -8,35 +8,35 @@ import pytest
 
 from opti_extensions import ParamDict1D, ParamDictND
 
+# Param-dicts shared by several parametrize rows are built once at import and never mutated
+PARAM1D_B1 = ParamDict1D({'B': 1})
+PARAM1D_A0_B1 = ParamDict1D({'A': 0, 'B': 1})
+PARAMND_CD1 = ParamDictND({('C', 'D'): 1})
+PARAMND_AB0_CD1 = ParamDictND({('A', 'B'): 0, ('C', 'D'): 1})
+
 
 @pytest.mark.parametrize(
-    '_input, _expected',
-    [
-        ('paramdict1d_emp', 'paramdict1d_emp'),
-        ('paramdict1d_pop3', 'paramdict1d_emp'),
-        ('paramdictNd_emp', 'paramdictNd_emp'),
-        ('paramdictNd_pop3', 'paramdictNd_emp'),
-    ],
+    'input_dict',
+    ['paramdict1d_emp_mut', 'paramdict1d_pop3_mut', 'paramdictNd_emp_mut', 'paramdictNd_pop3_mut'],
+    indirect=True,
 )
-def test_paramdict_clear_output_pass(request, _input, _expected):
-    input = request.getfixturevalue(_input)
-    expected = request.getfixturevalue(_expected)
-    input.clear()
-    assert input == expected
+def test_paramdict_clear_output_pass(input_dict):
+    input_dict.clear()
+    assert input_dict == type(input_dict)()
 
 
 @pytest.mark.parametrize(
-    '_input',
+    'input_dict',
     ['paramdict1d_emp', 'paramdict1d_pop3', 'paramdictNd_emp', 'paramdictNd_pop3'],
+    indirect=True,
 )
-def test_paramdict_copy_attrerr(request, _input):
-    input = request.getfixturevalue(_input)
+def test_paramdict_copy_attrerr(input_dict):
     with pytest.raises(AttributeError):
-        input.copy()
+        input_dict.copy()
 
 
 @pytest.mark.parametrize(
-    '_input, key, default, expected',
+    'input_dict, key, default, expected',
     [
         ('paramdict1d_emp', 'A', None, None),
         ('paramdict1d_emp', 'A', 9, 9),
@@ -51,109 +51,94 @@ def test_paramdict_copy_attrerr(request, _input):
         ('paramdictNd_pop3', ('Y', 'Z'), None, None),
         ('paramdictNd_pop3', ('Y', 'Z'), 9, 9),
     ],
+    indirect=['input_dict'],
 )
-def test_paramdict_get_pass(request, _input, key, default, expected):
-    input = request.getfixturevalue(_input)
-    value = input.get(key, default)
+def test_paramdict_get_pass(input_dict, key, default, expected):
+    value = input_dict.get(key, default)
     assert value == expected
 
 
 @pytest.mark.parametrize(
-    '_input, key, default, popped, expected',
+    'input_dict, key, default, popped, expected',
     [
-        ('paramdict1d_pop2', 'A', None, 0, ParamDict1D({'B': 1})),
-        ('paramdict1d_pop2', 'A', 9, 0, ParamDict1D({'B': 1})),
-        ('paramdict1d_pop2', 'Z', None, None, ParamDict1D({'A': 0, 'B': 1})),
-        ('paramdict1d_pop2', 'Z', 9, 9, ParamDict1D({'A': 0, 'B': 1})),
-        ('paramdict1d_pop2', 'Z', 9.0, 9.0, ParamDict1D({'A': 0, 'B': 1})),
-        ('paramdict1d_pop2', 'Z', '9', '9', ParamDict1D({'A': 0, 'B': 1})),
-        ('paramdict1d_pop2', 'Z', (8, 9), (8, 9), ParamDict1D({'A': 0, 'B': 1})),
-        ('paramdictNd_pop2', ('A', 'B'), None, 0, ParamDictND({('C', 'D'): 1})),
-        ('paramdictNd_pop2', ('A', 'B'), 9, 0, ParamDictND({('C', 'D'): 1})),
-        ('paramdictNd_pop2', ('Y', 'Z'), None, None, ParamDictND({('A', 'B'): 0, ('C', 'D'): 1})),
-        ('paramdictNd_pop2', ('Y', 'Z'), 9, 9, ParamDictND({('A', 'B'): 0, ('C', 'D'): 1})),
-        ('paramdictNd_pop2', ('Y', 'Z'), 9.0, 9.0, ParamDictND({('A', 'B'): 0, ('C', 'D'): 1})),
-        ('paramdictNd_pop2', ('Y', 'Z'), '9', '9', ParamDictND({('A', 'B'): 0, ('C', 'D'): 1})),
-        (
-            'paramdictNd_pop2',
-            ('Y', 'Z'),
-            (8, 9),
-            (8, 9),
-            ParamDictND({('A', 'B'): 0, ('C', 'D'): 1}),
-        ),
+        ('paramdict1d_pop2_mut', 'A', None, 0, PARAM1D_B1),
+        ('paramdict1d_pop2_mut', 'A', 9, 0, PARAM1D_B1),
+        ('paramdict1d_pop2_mut', 'Z', None, None, PARAM1D_A0_B1),
+        ('paramdict1d_pop2_mut', 'Z', 9, 9, PARAM1D_A0_B1),
+        ('paramdict1d_pop2_mut', 'Z', 9.0, 9.0, PARAM1D_A0_B1),
+        ('paramdict1d_pop2_mut', 'Z', '9', '9', PARAM1D_A0_B1),
+        ('paramdict1d_pop2_mut', 'Z', (8, 9), (8, 9), PARAM1D_A0_B1),
+        ('paramdictNd_pop2_mut', ('A', 'B'), None, 0, PARAMND_CD1),
+        ('paramdictNd_pop2_mut', ('A', 'B'), 9, 0, PARAMND_CD1),
+        ('paramdictNd_pop2_mut', ('Y', 'Z'), None, None, PARAMND_AB0_CD1),
+        ('paramdictNd_pop2_mut', ('Y', 'Z'), 9, 9, PARAMND_AB0_CD1),
+        ('paramdictNd_pop2_mut', ('Y', 'Z'), 9.0, 9.0, PARAMND_AB0_CD1),
+        ('paramdictNd_pop2_mut', ('Y', 'Z'), '9', '9', PARAMND_AB0_CD1),
+        ('paramdictNd_pop2_mut', ('Y', 'Z'), (8, 9), (8, 9), PARAMND_AB0_CD1),
     ],
+    indirect=['input_dict'],
 )
-def test_paramdict_pop_wdefault_pass(request, _input, key, default, popped, expected):
-    input = request.getfixturevalue(_input)
-    value = input.pop(key, default)
+def test_paramdict_pop_wdefault_pass(input_dict, key, default, popped, expected):
+    value = input_dict.pop(key, default)
     assert value == popped
-    assert input == expected
+    assert input_dict == expected
 
 
 @pytest.mark.parametrize(
-    '_input, key, popped, expected',
+    'input_dict, key, popped, expected',
     [
-        ('paramdict1d_pop2', 'A', 0, ParamDict1D({'B': 1})),
-        ('paramdict1d_pop2', 'A', 0, ParamDict1D({'B': 1})),
-        ('paramdictNd_pop2', ('A', 'B'), 0, ParamDictND({('C', 'D'): 1})),
-        ('paramdictNd_pop2', ('A', 'B'), 0, ParamDictND({('C', 'D'): 1})),
+        ('paramdict1d_pop2_mut', 'A', 0, PARAM1D_B1),
+        ('paramdict1d_pop2_mut', 'A', 0, PARAM1D_B1),
+        ('paramdictNd_pop2_mut', ('A', 'B'), 0, PARAMND_CD1),
+        ('paramdictNd_pop2_mut', ('A', 'B'), 0, PARAMND_CD1),
     ],
+    indirect=['input_dict'],
 )
-def test_paramdict_pop_wodefault_pass(request, _input, key, popped, expected):
-    input = request.getfixturevalue(_input)
-    value = input.pop(key)
+def test_paramdict_pop_wodefault_pass(input_dict, key, popped, expected):
+    value = input_dict.pop(key)
     assert value == popped
-    assert input == expected
+    assert input_dict == expected
 
 
 @pytest.mark.parametrize(
-    '_input, key',
+    'input_dict, key',
     [('paramdict1d_pop2', 'Z'), ('paramdictNd_pop2', ('Y', 'Z'))],
+    indirect=['input_dict'],
 )
-def test_paramdict_pop_wodefault_keyerr(request, _input, key):
-    input = request.getfixturevalue(_input)
+def test_paramdict_pop_wodefault_keyerr(input_dict, key):
     with pytest.raises(KeyError):
-        input.pop(key)
+        input_dict.pop(key)
 
 
 @pytest.mark.parametrize(
-    '_input, popped1, expected1, popped2, expected2',
+    'input_dict, sequence',
     [
-        ('paramdict1d_pop2', ('B', 1), ParamDict1D({'A': 0}), ('A', 0), ParamDict1D()),
+        ('paramdict1d_pop2_mut', [(('B', 1), ParamDict1D({'A': 0})), (('A', 0), ParamDict1D())]),
         (
-            'paramdictNd_pop2',
-            (('C', 'D'), 1),
-            ParamDictND({('A', 'B'): 0}),
-            (('A', 'B'), 0),
-            ParamDictND(),
+            'paramdictNd_pop2_mut',
+            [((('C', 'D'), 1), ParamDictND({('A', 'B'): 0})), ((('A', 'B'), 0), ParamDictND())],
         ),
     ],
+    indirect=['input_dict'],
 )
-def test_paramdict_popitem_pass(request, _input, popped1, expected1, popped2, expected2):
-    input = request.getfixturevalue(_input)
+def test_paramdict_popitem_pass(input_dict, sequence):
+    for popped, expected in sequence:
+        assert input_dict.popitem() == popped
+        assert input_dict == expected
 
-    value1 = input.popitem()
-    assert value1 == popped1
-    assert input == expected1
 
-    value2 = input.popitem()
-    assert value2 == popped2
-    assert input == expected2
-
-
-@pytest.mark.parametrize('_input', ['paramdict1d_emp', 'paramdictNd_emp'])
-def test_paramdict_popitem_emp_keyerr(request, _input):
-    input = request.getfixturevalue(_input)
+@pytest.mark.parametrize('input_dict', ['paramdict1d_emp', 'paramdictNd_emp'], indirect=True)
+def test_paramdict_popitem_emp_keyerr(input_dict):
     with pytest.raises(KeyError):
-        input.popitem()
+        input_dict.popitem()
 
 
 @pytest.mark.parametrize(
     'input, key, default, expected',
     [
-        (ParamDict1D({'A': 0}), 'B', 1, ParamDict1D({'A': 0, 'B': 1})),
-        (ParamDict1D({'A': 0}), 'B', 1.0, ParamDict1D({'A': 0, 'B': 1})),
-        (ParamDictND({('A', 'B'): 0}), ('C', 'D'), 1, ParamDictND({('A', 'B'): 0, ('C', 'D'): 1})),
+        (ParamDict1D({'A': 0}), 'B', 1, PARAM1D_A0_B1),
+        (ParamDict1D({'A': 0}), 'B', 1.0, PARAM1D_A0_B1),
+        (ParamDictND({('A', 'B'): 0}), ('C', 'D'), 1, PARAMND_AB0_CD1),
         (
             ParamDictND({('A', 'B'): 0}),
             ('C', 'D'),
@@ -167,16 +152,15 @@ def test_paramdict_setdefault_pass(request, input, key, default, expected):
     assert input == expected
 
 
-@pytest.mark.parametrize('_input', [('paramdict1d_pop3'), ('paramdictNd_pop3')])
+@pytest.mark.parametrize('input_dict', [('paramdict1d_pop3'), ('paramdictNd_pop3')], indirect=True)
 @pytest.mark.parametrize('default', ['1', int, [1, 2, 3], (1, 'A'), {1, 2}])
-def test_paramdict_setdefault_value_typerr(request, _input, default):
-    input = request.getfixturevalue(_input)
+def test_paramdict_setdefault_value_typerr(input_dict, default):
     with pytest.raises(TypeError):
-        input.setdefault('Z', default)
+        input_dict.setdefault('Z', default)
 
 
 @pytest.mark.parametrize(
-    '_input, key',
+    'input_dict, key',
     [
         ('paramdict1d_pop3', ('Y', 'Z')),
         ('paramdict1d_pop3', ['Y', 'Z']),
@@ -187,38 +171,32 @@ def test_paramdict_setdefault_value_typerr(request, _input, default):
         ('paramdictNd_pop3', ['Y', 'Z']),
         ('paramdictNd_pop3', {'Y', 'Z'}),
     ],
+    indirect=['input_dict'],
 )
-def test_paramdict_setdefault_key_typerr(request, _input, key):
-    input = request.getfixturevalue(_input)
+def test_paramdict_setdefault_key_typerr(input_dict, key):
     with pytest.raises(TypeError):
-        input.setdefault(key, 1)
+        input_dict.setdefault(key, 1)
 
 
 @pytest.mark.parametrize(
-    '_input, key',
+    'input_dict, key',
     [('paramdictNd_pop3', ('X', 'Y', 'Z')), ('paramdictNd_pop3', ('X',))],
+    indirect=['input_dict'],
 )
-def test_paramdictNd_setdefault_keydifflen_valerr(request, _input, key):
-    input = request.getfixturevalue(_input)
+def test_paramdictNd_setdefault_keydifflen_valerr(input_dict, key):
     with pytest.raises(ValueError):
-        input.setdefault(key, 1)
+        input_dict.setdefault(key, 1)
 
 
-@pytest.mark.parametrize(
-    '_input',
-    ['paramdict1d_emp', 'paramdict1d_pop3', 'paramdictNd_emp', 'paramdictNd_pop3'],
-)
-@pytest.mark.parametrize('other', [{}, {'Y': 8, 'Z': 9}, [('Y', 8), ('Z', 9)]])
-def test_paramdict_update_attrerr(request, _input, other):
-    input = request.getfixturevalue(_input)
-    with pytest.raises(AttributeError):
-        input.update(other)
+@pytest.mark.parametrize('cls', [ParamDict1D, ParamDictND])
+def test_paramdict_update_attrerr(cls):
+    input = cls()
+    for other in [{}, {'Y': 8, 'Z': 9}, [('Y', 8), ('Z', 9)]]:
+        with pytest.raises(AttributeError):
+            input.update(other)
 
 
-@pytest.mark.parametrize(
-    'cls, iterable',
-    [(ParamDict1D, ('A', 'B')), (ParamDictND, (('A', 'B'), ('C', 'D')))],
-)
-def test_paramdict_fromkeys_attrerr(cls, iterable):
+@pytest.mark.parametrize('cls', [ParamDict1D, ParamDictND])
+def test_paramdict_fromkeys_attrerr(cls):
     with pytest.raises(AttributeError):
-        cls.fromkeys(iterable)
+        cls.fromkeys([])
@@ -10,47 +10,47 @@ from opti_extensions import ParamDict1D, ParamDictND
 
 
 @pytest.mark.parametrize(
-    '_input',
+    'input_dict',
     ['paramdict1d_emp', 'paramdict1d_pop3', 'paramdictNd_emp', 'paramdictNd_pop3'],
+    indirect=True,
 )
 @pytest.mark.parametrize('index', ['Z', 1, ('Y', 'Z')])
-def test_paramdict_getitem_keyerr(request, _input, index):
-    input = request.getfixturevalue(_input)
+def test_paramdict_getitem_keyerr(input_dict, index):
     with pytest.raises(KeyError):
-        input[index]
+        input_dict[index]
 
 
 @pytest.mark.parametrize(
-    '_input, index, value, expected',
+    'input_dict, index, value, expected',
     [
-        ('paramdict1d_pop2', 'Z', 9, ParamDict1D({'A': 0, 'B': 1, 'Z': 9})),
-        ('paramdict1d_pop2', 'Z', 9.0, ParamDict1D({'A': 0, 'B': 1, 'Z': 9.0})),
+        ('paramdict1d_pop2_mut', 'Z', 9, ParamDict1D({'A': 0, 'B': 1, 'Z': 9})),
+        ('paramdict1d_pop2_mut', 'Z', 9.0, ParamDict1D({'A': 0, 'B': 1, 'Z': 9.0})),
         (
-            'paramdictNd_pop2',
+            'paramdictNd_pop2_mut',
             ('Y', 'Z'),
             9,
             ParamDictND({('A', 'B'): 0, ('C', 'D'): 1, ('Y', 'Z'): 9}),
         ),
         (
-            'paramdictNd_pop2',
+            'paramdictNd_pop2_mut',
             ('Y', 'Z'),
             9.0,
             ParamDictND({('A', 'B'): 0, ('C', 'D'): 1, ('Y', 'Z'): 9.0}),
         ),
-        ('paramdict1d_pop2', 'B', 9, ParamDict1D({'A': 0, 'B': 9})),
-        ('paramdict1d_pop2', 'B', 9.0, ParamDict1D({'A': 0, 'B': 9.0})),
-        ('paramdictNd_pop2', ('C', 'D'), 9, ParamDictND({('A', 'B'): 0, ('C', 'D'): 9})),
-        ('paramdictNd_pop2', ('C', 'D'), 9.0, ParamDictND({('A', 'B'): 0, ('C', 'D'): 9.0})),
+        ('paramdict1d_pop2_mut', 'B', 9, ParamDict1D({'A': 0, 'B': 9})),
+        ('paramdict1d_pop2_mut', 'B', 9.0, ParamDict1D({'A': 0, 'B': 9.0})),
+        ('paramdictNd_pop2_mut', ('C', 'D'), 9, ParamDictND({('A', 'B'): 0, ('C', 'D'): 9})),
+        ('paramdictNd_pop2_mut', ('C', 'D'), 9.0, ParamDictND({('A', 'B'): 0, ('C', 'D'): 9.0})),
     ],
+    indirect=['input_dict'],
 )
-def test_paramdict_setitem_pass(request, _input, index, value, expected):
-    input = request.getfixturevalue(_input)
-    input[index] = value
-    assert input == expected
+def test_paramdict_setitem_pass(input_dict, index, value, expected):
+    input_dict[index] = value
+    assert input_dict == expected
 
 
 @pytest.mark.parametrize(
-    '_input, index, value, err',
+    'input_dict, index, value, err',
     [
         ('paramdict1d_pop2', ('Y', 'Z'), 9, TypeError),
         ('paramdict1d_pop2', {'X', 'Y', 'Z'}, 9, TypeError),
@@ -60,43 +60,42 @@ def test_paramdict_setitem_pass(request, _input, index, value, expected):
         ('paramdictNd_pop2', ('X', 'Y', 'Z'), 9, ValueError),
         ('paramdictNd_pop2', ('X',), 9, ValueError),
     ],
+    indirect=['input_dict'],
 )
-def test_paramdict_setitem_idxset_err(request, _input, index, value, err):
-    input = request.getfixturevalue(_input)
+def test_paramdict_setitem_idxset_err(input_dict, index, value, err):
     with pytest.raises(err):
-        input[index] = value
+        input_dict[index] = value
 
 
 @pytest.mark.parametrize(
-    '_input, index',
+    'input_dict, index',
     [('paramdict1d_pop2', 'Z'), ('paramdictNd_pop2', ('Y', 'Z'))],
+    indirect=['input_dict'],
 )
 @pytest.mark.parametrize('value', ['DEF', [1, 2, 3], (1, 2, 3), {1, 2, 3}])
-def test_paramdict_setitem_val_typerr(request, _input, index, value):
-    input = request.getfixturevalue(_input)
+def test_paramdict_setitem_val_typerr(input_dict, index, value):
     with pytest.raises(TypeError):
-        input[index] = value
+        input_dict[index] = value
 
 
 @pytest.mark.parametrize(
-    '_input, key, _expected',
+    'input_dict, key, expected_dict',
     [
-        ('paramdict1d_pop3', 'C', 'paramdict1d_pop2'),
-        ('paramdictNd_pop3', ('E', 'F'), 'paramdictNd_pop2'),
+        ('paramdict1d_pop3_mut', 'C', 'paramdict1d_pop2'),
+        ('paramdictNd_pop3_mut', ('E', 'F'), 'paramdictNd_pop2'),
     ],
+    indirect=['input_dict', 'expected_dict'],
 )
-def test_paramdict_delitem_pass(request, _input, key, _expected):
-    input = request.getfixturevalue(_input)
-    expected = request.getfixturevalue(_expected)
-    del input[key]
-    assert input == expected
+def test_paramdict_delitem_pass(input_dict, key, expected_dict):
+    del input_dict[key]
+    assert input_dict == expected_dict
 
 
 @pytest.mark.parametrize(
-    '_input, key',
+    'input_dict, key',
     [('paramdict1d_pop3', 'Z'), ('paramdictNd_pop3', ('Y', 'Z'))],
+    indirect=['input_dict'],
 )
-def test_paramdict_delitem_keyerr(request, _input, key):
-    input = request.getfixturevalue(_input)
+def test_paramdict_delitem_keyerr(input_dict, key):
     with pytest.raises(KeyError):
-        del input[key]
+        del input_dict[key]
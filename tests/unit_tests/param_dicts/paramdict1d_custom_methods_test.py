@@ -12,123 +12,51 @@ from opti_extensions import ParamDict1D
 
 
 @pytest.mark.parametrize(
-    '_input, key, present',
+    'input_dict, key, present',
     [('paramdict1d_pop3', 'A', True), ('paramdict1d_pop3', 'Z', False)],
+    indirect=['input_dict'],
 )
-def test_vardict1d_lookup_pass(request, _input, key, present):
-    input = request.getfixturevalue(_input)
-    value = input.lookup(key)
+def test_vardict1d_lookup_pass(input_dict, key, present):
+    value = input_dict.lookup(key)
     if present:
-        assert value is input[key]
+        assert value is input_dict[key]
     else:
         assert value == 0
 
 
-@pytest.mark.parametrize(
-    'input, expected',
-    [
-        (ParamDict1D({'A': 1, 'B': 2}), 3),
-        (ParamDict1D({'A': 1.0, 'B': 2}), 3.0),
-        (ParamDict1D({'A': 1, 'B': 2.0}), 3.0),
-        (ParamDict1D({'A': 1.0, 'B': 2.0}), 3.0),
-    ],
-)
-def test_paramdict1d_sum_pass(input, expected):
-    assert input.sum() == expected
-
-
-@pytest.mark.parametrize(
-    'input, expected',
-    [
-        (ParamDict1D({'A': 1, 'B': 2}), 1),
-        (ParamDict1D({'A': 1.0, 'B': 2}), 1.0),
-        (ParamDict1D({'A': 1, 'B': 2.0}), 1),
-        (ParamDict1D({'A': 1.0, 'B': 2.0}), 1.0),
-    ],
-)
-def test_paramdict1d_min_pass(input, expected):
-    assert input.min() == expected
-
-
-@pytest.mark.parametrize(
-    'input, expected',
-    [
-        (ParamDict1D({'A': 1, 'B': 2}), 2),
-        (ParamDict1D({'A': 1.0, 'B': 2}), 2),
-        (ParamDict1D({'A': 1, 'B': 2.0}), 2.0),
-        (ParamDict1D({'A': 1.0, 'B': 2.0}), 2.0),
-    ],
-)
-def test_paramdict1d_max_pass(input, expected):
-    assert input.max() == expected
-
-
-@pytest.mark.parametrize(
-    'input, expected',
-    [
-        (ParamDict1D({'A': 1, 'B': 2}), 1.5),
-        (ParamDict1D({'A': 1.0, 'B': 2}), 1.5),
-        (ParamDict1D({'A': 1, 'B': 2.0}), 1.5),
-        (ParamDict1D({'A': 1.0, 'B': 2.0}), 1.5),
-        (ParamDict1D({'A': 1, 'B': 3}), 2),
-        (ParamDict1D({'A': 1.0, 'B': 3.0}), 2.0),
-    ],
-)
-def test_paramdict1d_mean_pass(input, expected):
-    assert input.mean() == expected
-
-
-@pytest.mark.parametrize(
-    'input, expected',
-    [
-        (ParamDict1D({'A': 1, 'B': 2}), 1.5),
-        (ParamDict1D({'A': 1.0, 'B': 2}), 1.5),
-        (ParamDict1D({'A': 1, 'B': 2.0}), 1.5),
-        (ParamDict1D({'A': 1.0, 'B': 2.0}), 1.5),
-        (ParamDict1D({'A': 1, 'B': 3}), 2),
-        (ParamDict1D({'A': 1.0, 'B': 3.0}), 2.0),
-        (ParamDict1D({'A': 1, 'B': 2, 'C': 7}), 2),
-        (ParamDict1D({'A': 1.0, 'B': 2, 'C': 7}), 2),
-        (ParamDict1D({'A': 1, 'B': 2.0, 'C': 7}), 2.0),
-        (ParamDict1D({'A': 1.0, 'B': 2.0, 'C': 7}), 2.0),
-        (ParamDict1D({'A': 1, 'B': 3, 'C': 7}), 3),
-        (ParamDict1D({'A': 1.0, 'B': 3.0, 'C': 7}), 3.0),
-    ],
-)
-def test_paramdict1d_median_pass(input, expected):
-    assert input.median() == expected
+STAT_FUNCS = ('sum', 'min', 'max', 'mean', 'median', 'median_high', 'median_low')
 
 
 @pytest.mark.parametrize(
-    'input, expected',
+    'data, sum_, min_, max_, mean, median, median_high, median_low',
     [
-        (ParamDict1D({'A': 1, 'B': 2, 'C': 7, 'D': 8}), 7),
-        (ParamDict1D({'A': 1, 'B': 2.0, 'C': 7, 'D': 8}), 7),
-        (ParamDict1D({'A': 1, 'B': 2, 'C': 7.0, 'D': 8}), 7.0),
-        (ParamDict1D({'A': 1, 'B': 2.0, 'C': 7.0, 'D': 8}), 7.0),
+        ({'A': 1, 'B': 2}, 3, 1, 2, 1.5, 1.5, 2, 1),
+        ({'A': 1.0, 'B': 2}, 3.0, 1.0, 2, 1.5, 1.5, 2, 1.0),
+        ({'A': 1, 'B': 2.0}, 3.0, 1, 2.0, 1.5, 1.5, 2.0, 1),
+        ({'A': 1.0, 'B': 2.0}, 3.0, 1.0, 2.0, 1.5, 1.5, 2.0, 1.0),
+        ({'A': 1, 'B': 3}, 4, 1, 3, 2, 2, 3, 1),
+        ({'A': 1.0, 'B': 3.0}, 4.0, 1.0, 3.0, 2.0, 2.0, 3.0, 1.0),
+        ({'A': 1, 'B': 2, 'C': 7}, 10, 1, 7, 10 / 3, 2, 2, 2),
+        ({'A': 1.0, 'B': 2, 'C': 7}, 10.0, 1.0, 7, 10 / 3, 2, 2, 2),
+        ({'A': 1, 'B': 2.0, 'C': 7}, 10.0, 1, 7, 10 / 3, 2.0, 2.0, 2.0),
+        ({'A': 1.0, 'B': 2.0, 'C': 7}, 10.0, 1.0, 7, 10 / 3, 2.0, 2.0, 2.0),
+        ({'A': 1, 'B': 3, 'C': 7}, 11, 1, 7, 11 / 3, 3, 3, 3),
+        ({'A': 1.0, 'B': 3.0, 'C': 7}, 11.0, 1.0, 7, 11 / 3, 3.0, 3.0, 3.0),
+        ({'A': 1, 'B': 2, 'C': 7, 'D': 8}, 18, 1, 8, 4.5, 4.5, 7, 2),
+        ({'A': 1, 'B': 2.0, 'C': 7, 'D': 8}, 18.0, 1, 8, 4.5, 4.5, 7, 2.0),
+        ({'A': 1, 'B': 2, 'C': 7.0, 'D': 8}, 18.0, 1, 8, 4.5, 4.5, 7.0, 2),
+        ({'A': 1, 'B': 2.0, 'C': 7.0, 'D': 8}, 18.0, 1, 8, 4.5, 4.5, 7.0, 2.0),
     ],
 )
-def test_paramdict1d_median_high_pass(input, expected):
-    assert input.median_high() == expected
+def test_paramdict1d_stat_pass(data, sum_, min_, max_, mean, median, median_high, median_low):
+    input = ParamDict1D(data)
+    expected = (sum_, min_, max_, mean, median, median_high, median_low)
+    for stat_func, exp in zip(STAT_FUNCS, expected, strict=True):
+        assert getattr(input, stat_func)() == exp, stat_func
 
 
-@pytest.mark.parametrize(
-    'input, expected',
-    [
-        (ParamDict1D({'A': 1, 'B': 2, 'C': 7, 'D': 8}), 2),
-        (ParamDict1D({'A': 1, 'B': 2.0, 'C': 7, 'D': 8}), 2.0),
-        (ParamDict1D({'A': 1, 'B': 2, 'C': 7.0, 'D': 8}), 2),
-        (ParamDict1D({'A': 1, 'B': 2.0, 'C': 7.0, 'D': 8}), 2.0),
-    ],
-)
-def test_paramdict1d_median_low_pass(input, expected):
-    assert input.median_low() == expected
-
-
-@pytest.mark.parametrize(
-    'stat_func', ['sum', 'min', 'max', 'mean', 'median', 'median_high', 'median_low']
-)
-def test_paramdict1d_empty_stat_err(stat_func):
+def test_paramdict1d_empty_stat_err():
     prm = ParamDict1D()
-    with pytest.raises(StatisticsError):
-        getattr(prm, stat_func)()
+    for stat_func in STAT_FUNCS:
+        with pytest.raises(StatisticsError):
+            getattr(prm, stat_func)()
@@ -9,33 +9,32 @@ from statistics import StatisticsError
 import pytest
 
 from opti_extensions import ParamDictND
+from opti_extensions._param_dicts import _STAT_CACHE_MAXSIZE
 
 
 @pytest.mark.parametrize(
-    '_input, key, present',
+    'input_dict, key, present',
     [('paramdictNd_pop3', ('A', 'B'), True), ('paramdictNd_pop3', ('Y', 'Z'), False)],
+    indirect=['input_dict'],
 )
-def test_vardict1d_lookup_pass(request, _input, key, present):
-    input = request.getfixturevalue(_input)
-    value = input.lookup(*key)
+def test_vardict1d_lookup_pass(input_dict, key, present):
+    value = input_dict.lookup(*key)
     if present:
-        assert value is input[key]
+        assert value is input_dict[key]
     else:
         assert value == 0
 
 
-@pytest.mark.parametrize('key', [[13], (0, 0), ()])
-def test_vardictNd_lookup_typerr(request, key):
-    input = request.getfixturevalue('paramdictNd_pop2')
+@pytest.mark.parametrize('key', [[13], (0, 0), (), {'A'}])
+def test_vardictNd_lookup_typerr(paramdictNd_pop2, key):
     with pytest.raises(TypeError):
-        input.lookup(key)
+        paramdictNd_pop2.lookup(key)
 
 
 @pytest.mark.parametrize('key', [(), (0, 0, 0), (1, 2, 3, 4)])
-def test_vardictNd_lookup_valerr(request, key):
-    input = request.getfixturevalue('paramdictNd_pop2')
+def test_vardictNd_lookup_valerr(paramdictNd_pop2, key):
     with pytest.raises(ValueError):
-        input.lookup(*key)
+        paramdictNd_pop2.lookup(*key)
 
 
 @pytest.mark.parametrize(
@@ -322,3 +321,49 @@ def test_paramdictNd_stat_partial_typerr(paramdictNd_pop3, stat_func):
 def test_check_for_calc_stat_valerr(paramdictNd_pop3, stat_func):
     with pytest.raises(ValueError):
         paramdictNd_pop3._check_for_calc_stat(stat_func)
+
+
+@pytest.mark.parametrize(
+    'mutate',
+    [
+        lambda prm: prm.__setitem__(('A', 'B'), 9),
+        lambda prm: prm.__setitem__(('A', 'Z'), 9),
+        lambda prm: prm.__delitem__(('A', 'B')),
+        lambda prm: prm.pop(('A', 'B')),
+        lambda prm: prm.popitem(),
+        lambda prm: prm.setdefault(('A', 'Z'), 9),
+    ],
+    ids=['setitem_existing', 'setitem_new', 'delitem', 'pop', 'popitem', 'setdefault'],
+)
+@pytest.mark.parametrize('stat_func', all_stat_funcs)
+def test_paramdictNd_stat_partial_after_mutation(mutate, stat_func):
+    prm = ParamDictND({('A', 'B'): 1, ('C', 'D'): 2, ('A', 'D'): 7})
+    _ = getattr(prm, stat_func)('A', '*')
+    mutate(prm)
+
+    expected = getattr(ParamDictND(dict(prm)), stat_func)('A', '*')
+    assert getattr(prm, stat_func)('A', '*') == expected
+
+
+def test_paramdictNd_stat_partial_after_clear():
+    prm = ParamDictND({('A', 'B'): 1, ('C', 'D'): 2, ('A', 'D'): 7})
+    _ = prm.sum('A', '*')
+    prm.clear()
+
+    with pytest.raises(StatisticsError):
+        prm.sum('A', '*')
+
+
+def test_paramdictNd_stat_partial_cache_maxsize():
+    prm = ParamDictND({(i, 0): i for i in range(_STAT_CACHE_MAXSIZE + 1)})
+    for i in range(_STAT_CACHE_MAXSIZE + 1):
+        assert prm.sum(i, '*') == i
+    assert len(prm._stat_cache) == _STAT_CACHE_MAXSIZE
+    assert ('sum', (0, '*')) not in prm._stat_cache
+    assert ('sum', (_STAT_CACHE_MAXSIZE, '*')) in prm._stat_cache
+
+    # Re-querying the evicted pattern recalculates it and evicts the next oldest entry
+    assert prm.sum(0, '*') == 0
+    assert len(prm._stat_cache) == _STAT_CACHE_MAXSIZE
+    assert ('sum', (0, '*')) in prm._stat_cache
+    assert ('sum', (1, '*')) not in prm._stat_cache
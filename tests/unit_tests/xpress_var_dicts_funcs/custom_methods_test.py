@@ -7,57 +7,52 @@
 import pytest
 import xpress as xp
 
-from opti_extensions import IndexSet1D, IndexSetND
-from opti_extensions.xpress import addVariables
+from opti_extensions import IndexSet1D
 
 # Import all shared tests
 from tests.unit_tests._shared_custom_methods_tests import *  # noqa: F401, F403
-from tests.unit_tests._shared_custom_methods_tests import SUM_PARTIAL_PASS_CASES
+from tests.unit_tests._shared_custom_methods_tests import (
+    SETND_ABC_CMB2,
+    SETND_CMB2,
+    SUM_PARTIAL_PASS_CASES,
+    SUM_PARTIAL_VALERR_CASES,
+)
 
 # ---- Solver-specific: sum tests (xpress uses xp.Sum) ----
 
 SUM_INDEXSETS = [
     IndexSet1D(['A', 'B', 'C']),
     IndexSet1D(range(3)),
-    IndexSetND(range(2), range(2)),
-    IndexSetND(['A', 'B', 'C'], range(2)),
+    SETND_CMB2,
+    SETND_ABC_CMB2,
 ]
 
 
 @pytest.mark.parametrize('indexset', SUM_INDEXSETS)
-def test_vardict_sum_pass(prob, indexset):
-    v = addVariables(prob, indexset, vartype=xp.continuous, name='')
+def test_vardict_sum_pass(cached_vardict, indexset):
+    v = cached_vardict(indexset)
     assert str(v.sum()) == str(xp.Sum(x for x in v.values()))
     assert str(v.sum_squares()) == str(xp.Sum(x**2 for x in v.values()))
 
 
 @pytest.mark.parametrize('indexset, pattern', SUM_PARTIAL_PASS_CASES)
-def test_vardictNd_sum_partial_pass(prob, indexset, pattern):
-    v = addVariables(prob, indexset, vartype=xp.continuous, name='')
-
-    def _match(key, pattern):
-        return all(p in (k, '*') for k, p in zip(key, pattern, strict=False))
-
-    assert str(v.sum(*pattern)) == str(
-        xp.Sum(var for idx, var in v.items() if _match(idx, pattern))
-    )
-    assert str(v.sum_squares(*pattern)) == str(
-        xp.Sum(var**2 for idx, var in v.items() if _match(idx, pattern))
-    )
+def test_vardictNd_sum_partial_pass(cached_vardict, indexset, pattern):
+    v = cached_vardict(indexset)
+    wild = tuple(p == '*' for p in pattern)
+    matched = [
+        var
+        for idx, var in v.items()
+        if all(w or k == p for k, p, w in zip(idx, pattern, wild, strict=True))
+    ]
+    assert str(v.sum(*pattern)) == str(xp.Sum(matched))
+    assert str(v.sum_squares(*pattern)) == str(xp.Sum(var**2 for var in matched))
 
 
 # ---- Solver-specific: sum_squares partial valerr ----
 
 
-@pytest.mark.parametrize(
-    'indexset, pattern',
-    [
-        [IndexSetND(range(2), range(2)), (0, 0)],
-        [IndexSetND(range(2), range(2)), ('*', '*')],
-        [IndexSetND(range(2), range(2)), (0, 0, 0)],
-    ],
-)
-def test_vardictNd_sum_squares_partial_valerr(prob, indexset, pattern):
-    v = addVariables(prob, indexset, vartype=xp.continuous, name='')
+@pytest.mark.parametrize('indexset, pattern', SUM_PARTIAL_VALERR_CASES)
+def test_vardictNd_sum_squares_partial_valerr(cached_vardict, indexset, pattern):
+    v = cached_vardict(indexset)
     with pytest.raises(ValueError):
         v.sum_squares(*pattern)
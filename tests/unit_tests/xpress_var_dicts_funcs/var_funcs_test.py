@@ -18,15 +18,18 @@ from tests.unit_tests._shared_var_funcs_tests import SHARED_INDEXSET_CASES
     'vartype', [xp.continuous, xp.binary, xp.integer, xp.semicontinuous, xp.semiinteger]
 )
 def test_addVariables_pass(prob, prob_2, indexset, vartype, request):
-    name = request.node.nodeid.split('/')[-1]
+    name = request.node.name
 
     one = addVariables(prob, indexset, vartype=vartype, name=name)
-    repr_one = repr(dict(one))
+    # Capture the reprs before the reset invalidates the variables of `one`
+    items_one = [(key, repr(var)) for key, var in one.items()]
     prob.reset()
 
     two = prob_2.addVariables(indexset, vartype=vartype, name=name)
 
-    assert repr_one == repr(two)
+    assert [key for key, _ in items_one] == list(two.keys())
+    for key, repr_var in items_one:
+        assert repr_var == repr(two[key])
 
 
 @pytest.mark.parametrize(
@@ -38,11 +41,12 @@ def test_addVariables_pass(prob, prob_2, indexset, vartype, request):
 )
 @pytest.mark.parametrize('bound_type', ['lb', 'ub'])
 def test_addVariables_paramdict_bound(prob, indexset, paramdict, bound_type, request):
-    name = request.node.nodeid.split('/')[-1]
+    name = request.node.name
 
     bound_kwargs_1 = {bound_type: paramdict}
     one = addVariables(prob, indexset, vartype=xp.continuous, name=name, **bound_kwargs_1)
-    repr_one = repr(dict(one))
+    # Capture the reprs before the reset invalidates the variables of `one`
+    items_one = [(key, repr(var)) for key, var in one.items()]
     prob.reset()
 
     if bound_type == 'lb':
@@ -60,4 +64,6 @@ def test_addVariables_paramdict_bound(prob, indexset, paramdict, bound_type, req
             for elem in indexset
         }
 
-    assert repr_one == repr(two)
+    assert [key for key, _ in items_one] == list(two.keys())
+    for key, repr_var in items_one:
+        assert repr_var == repr(two[key])